@@ -3,6 +3,8 @@
 
 import math
 
+import numpy as np
+
 def f1(x: float) -> float:
     """
     f1(x) = sin(pi * x), x en [0, 1].
@@ -19,4 +21,17 @@ def f2(x: float) -> float:
     f2(x) = phi(x) = (1/sqrt(2*pi)) * exp(-x^2/2), x en [0, 2].
     Integral en [0,2]: Phi(2) - Phi(0) ≈ 0.4772498680518208.
     """
-    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
\ No newline at end of file
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+# ---- versiones vectorizadas (NumPy): aceptan escalares o arrays ----
+def f1_vec(x):
+    """f1 sobre arrays: sin(pi * x)."""
+    return np.sin(np.pi * x)
+
+
+def f2_vec(x):
+    """f2 sobre arrays: phi(x) = (1/sqrt(2*pi)) * exp(-x^2/2)."""
+    x = np.asarray(x, dtype=np.float64)
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
@@ -0,0 +1,167 @@
+# montecarlo/integrate.py
+# Integrador Monte Carlo vectorizado: Î = (b-a)*mean(f(a+(b-a)U)), U~Unif(0,1).
+# Extrae bloques de uniformes del generador y evalúa integrandos compatibles con
+# ufuncs (p.ej. f1_vec/f2_vec). Momentos en streaming (Chan/Welford por bloques):
+# memoria acotada por el tamaño de bloque, independiente de N.
+# integrate_sharded: N repartido en shards con subflujos disjuntos (en paralelo con un
+# executor); los momentos parciales se combinan en orden de shard → resultado
+# determinista para un nº de shards dado, sin importar el nº de workers.
+# integrate_stream_sharded: shards = tramos contiguos de un mismo flujo con jump(); en
+# serie se recorre el flujo sin saltos, con executor cada worker salta su copia.
+# integrate_adaptive: lotes crecientes hasta alcanzar la precisión pedida (StoppingRule).
+
+import copy
+import math
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .sequential import StoppingRule, Z_95
+
+CHUNK = 1 << 16     # uniformes por bloque
+
+
+def uniforms(rng, k: int) -> np.ndarray:
+    """k uniformes en [0,1): rng.random_array(k) si existe; si no, k llamadas a rng.random()."""
+    batch = getattr(rng, "random_array", None)
+    if batch is not None:
+        return batch(k)
+    return np.fromiter((rng.random() for _ in range(k)), dtype=np.float64, count=k)
+
+
+class RunningMoments:
+    """n, media y M2 = Σ(x - x̄)^2 acumulados por bloques (fórmula de Chan); combinables."""
+
+    def __init__(self, n: int = 0, mean: float = 0.0, M2: float = 0.0):
+        self.n, self.mean, self.M2 = int(n), float(mean), float(M2)
+
+    def update(self, chunk) -> "RunningMoments":
+        x = np.asarray(chunk, dtype=np.float64).ravel()
+        if x.size:
+            m = float(x.mean())                       # sumas por pares (NumPy)
+            d = x - m
+            self.merge(RunningMoments(x.size, m, float(np.dot(d, d))))
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.M2 += other.M2 + delta * delta * self.n * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def var(self) -> float:
+        # varianza muestral (n-1)
+        return self.M2 / (self.n - 1) if self.n > 1 else 0.0
+
+
+def estimate(moments: RunningMoments, w: float) -> Tuple[float, float, Tuple[float, float]]:
+    """(est, se, ci95) a partir de los momentos de f(X) y el ancho w = b-a."""
+    est = w * moments.mean
+    se = w * math.sqrt(moments.var / moments.n) if moments.n else float("nan")
+    return est, se, (est - Z_95 * se, est + Z_95 * se)
+
+
+def _moments(f: Callable, a: float, b: float, rng, n: int, chunk: int) -> RunningMoments:
+    # momentos de f(a + (b-a)U) sobre n muestras por bloques (también tarea de un shard:
+    # función de módulo, serializable para ProcessPoolExecutor)
+    w = (b - a)
+    mom = RunningMoments()
+    done = 0
+    while done < n:
+        k = min(chunk, n - done)
+        mom.update(f(a + w * uniforms(rng, k)))
+        done += k
+    return mom
+
+
+def integrate(f: Callable, a: float, b: float, rng, n: int, chunk: int = CHUNK):
+    """
+    Î de ∫_a^b f con n muestras por bloques de 'chunk'. f debe aceptar arrays.
+    Retorna (est, se, ci) como run_parte2.mc_integral_stats.
+    """
+    return estimate(_moments(f, a, b, rng, n, chunk), b - a)
+
+
+def integrate_adaptive(f: Callable, a: float, b: float, rng, rule: StoppingRule,
+                       chunk: int = CHUNK) -> Dict[str, Any]:
+    """
+    Î de ∫_a^b f en lotes crecientes hasta que el IC cumple rule (o se agota rule.max_n).
+    Retorna {"est", "se", "ci", "n", "time_s", "converged"}.
+    """
+    t0 = time.perf_counter()
+    mom = RunningMoments()
+    est, se, ci = float("nan"), float("nan"), (float("nan"), float("nan"))
+    converged = False
+    for k in rule.batches():
+        mom.merge(_moments(f, a, b, rng, k, chunk))
+        est, se, ci = estimate(mom, b - a)
+        if rule.met(est, se, mom.n):
+            converged = True
+            break
+    return {"est": est, "se": se, "ci": ci, "n": mom.n,
+            "time_s": time.perf_counter() - t0, "converged": converged}
+
+
+def shard_sizes(n: int, shards: int) -> List[int]:
+    """Reparte n en 'shards' tamaños casi iguales (los primeros reciben el resto)."""
+    q, r = divmod(int(n), int(shards))
+    return [q + (1 if i < r else 0) for i in range(int(shards))]
+
+
+def substream(rng, offset: int):
+    """Copia de rng avanzada 'offset' pasos con rng.jump() (el original no cambia)."""
+    g = copy.deepcopy(rng)
+    if offset:
+        g.jump(offset)
+    return g
+
+
+def _shard_moments(f: Callable, a: float, b: float, rng, skip: int, n: int,
+                   chunk: int) -> RunningMoments:
+    # tarea de un shard: el salto hasta su tramo se hace en el worker
+    return _moments(f, a, b, substream(rng, skip), n, chunk)
+
+
+def integrate_stream_sharded(f: Callable, a: float, b: float, rng, sizes: Sequence[int],
+                             executor=None, offset: int = 0, chunk: int = CHUNK):
+    """
+    Como integrate_sharded con rngs[i] = substream(rng, offset + Σ sizes[:i]) (rng con
+    jump()), sin crear los subflujos en el proceso llamador: sin executor los tramos se
+    leen en orden de una sola copia (un salto, el de offset); con executor cada worker
+    copia rng y salta a su tramo. Mismo resultado en ambos casos. rng no cambia.
+    """
+    sizes = [int(s) for s in sizes]
+    if executor is None:
+        g = substream(rng, offset)
+        parts = [_moments(f, a, b, g, s, chunk) for s in sizes]
+    else:
+        skips = [offset + sum(sizes[:i]) for i in range(len(sizes))]
+        n = len(sizes)
+        parts = executor.map(_shard_moments, [f] * n, [a] * n, [b] * n, [rng] * n, skips,
+                             sizes, [chunk] * n)
+    mom = RunningMoments()
+    for part in parts:                  # en orden de shard
+        mom.merge(part)
+    return estimate(mom, b - a)
+
+
+def integrate_sharded(f: Callable, a: float, b: float, rngs: Sequence, sizes: Sequence[int],
+                      executor=None, chunk: int = CHUNK):
+    """
+    Î de ∫_a^b f con sizes[i] muestras del generador rngs[i] (subflujos disjuntos).
+    executor (p.ej. ProcessPoolExecutor) opcional; sin él los shards corren en serie.
+    Retorna (est, se, ci).
+    """
+    n = len(sizes)
+    args = ([f] * n, [a] * n, [b] * n, list(rngs), list(sizes), [chunk] * n)
+    parts = executor.map(_moments, *args) if executor is not None else map(_moments, *args)
+    mom = RunningMoments()
+    for part in parts:                  # map conserva el orden de los shards
+        mom.merge(part)
+    return estimate(mom, b - a)
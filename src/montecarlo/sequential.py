@@ -0,0 +1,69 @@
+# montecarlo/sequential.py
+# Regla de parada secuencial: se muestrea en lotes crecientes (n0, n0·g, n0·g², ...)
+# hasta que la semiamplitud del IC, z·SE, cumple el objetivo
+#   z·SE ≤ max(abs_tol, rel_tol·|est|)
+# o se agota el presupuesto max_n. Sirve para cualquier estimador con (est, SE), p.ej.
+# integrales Monte Carlo (integrate_adaptive).
+# RejectionRule: misma secuencia de lotes para una prueba de hipótesis (Parte 1): se
+# detiene cuando el p-valor acumulado rechaza H0 (nivel corregido por las miradas
+# previstas) o en max_n. No usar el IC de la media de U: Var(U) = 1/12 para cualquier
+# generador no degenerado, así que ese criterio fija n ≈ z²/(12·tol²) para todos.
+
+from typing import Iterator, Optional
+
+Z_95 = 1.96
+
+
+class StoppingRule:
+    def __init__(self, abs_tol: Optional[float] = None, rel_tol: Optional[float] = None,
+                 max_n: int = 10**8, n0: int = 10_000, growth: float = 2.0, z: float = Z_95):
+        if abs_tol is None and rel_tol is None:
+            raise ValueError("se requiere abs_tol o rel_tol.")
+        if growth < 1.0 or n0 < 2 or max_n < n0:
+            raise ValueError("se requiere growth ≥ 1, n0 ≥ 2 y max_n ≥ n0.")
+        self.abs_tol, self.rel_tol = abs_tol, rel_tol
+        self.max_n, self.n0, self.growth, self.z = int(max_n), int(n0), float(growth), float(z)
+
+    def target(self, est: float) -> float:
+        # semiamplitud objetivo para la estimación actual
+        return max(self.abs_tol or 0.0, (self.rel_tol or 0.0) * abs(est))
+
+    def met(self, est: float, se: float, n: int) -> bool:
+        return n >= self.n0 and self.z * se <= self.target(est)
+
+    def batches(self) -> Iterator[int]:
+        return _batches(self.n0, self.max_n, self.growth)
+
+
+def _batches(n0: int, max_n: int, growth: float) -> Iterator[int]:
+    # tamaños de lote crecientes hasta completar max_n
+    done, size = 0, n0
+    while done < max_n:
+        k = min(size, max_n - done)
+        yield k
+        done += k
+        size = max(size, int(size * growth))
+
+
+class RejectionRule:
+    """
+    Parada secuencial de una prueba de hipótesis: lotes crecientes hasta que el p-valor
+    acumulado cae bajo alpha / looks (Bonferroni sobre las miradas previstas: nivel
+    global ≤ alpha) o se agota max_n. Un generador sano llega a max_n; uno defectuoso se
+    detiene en cuanto el rechazo es claro (n = muestras necesarias para detectarlo).
+    """
+
+    def __init__(self, alpha: float = 0.01, max_n: int = 10**6, n0: int = 10_000,
+                 growth: float = 2.0):
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("se requiere 0 < alpha < 1.")
+        if growth < 1.0 or n0 < 2 or max_n < n0:
+            raise ValueError("se requiere growth ≥ 1, n0 ≥ 2 y max_n ≥ n0.")
+        self.alpha, self.max_n, self.n0, self.growth = float(alpha), int(max_n), int(n0), float(growth)
+        self.looks = sum(1 for _ in self.batches())
+
+    def met(self, p: float, n: int) -> bool:
+        return n >= self.n0 and p < self.alpha / self.looks
+
+    def batches(self) -> Iterator[int]:
+        return _batches(self.n0, self.max_n, self.growth)
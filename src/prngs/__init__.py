@@ -1,5 +1,28 @@
-from .lcg import LCG
-from .middle_square import MiddleSquare
-from .mt19937 import MT19937
-from .bbs import BlumBlumShub
-from .randu import RANDU
+# Exportaciones perezosas (PEP 562): "import prngs" no carga numpy ni los generadores;
+# cada clase se importa al primer acceso (from prngs import LCG, prngs.MT19937, pickle).
+import importlib
+
+_EXPORTS = {
+    "BasePRNG":     ".base",
+    "LCG":          ".lcg",
+    "MiddleSquare": ".middle_square",
+    "MT19937":      ".mt19937",
+    "BlumBlumShub": ".bbs",
+    "RANDU":        ".randu",
+    "NumpyBitGenerator": ".adapters",
+    "PRNGRandom":   ".adapters",
+}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    mod = _EXPORTS.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(mod, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
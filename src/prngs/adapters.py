@@ -0,0 +1,173 @@
+# prngs/adapters.py
+# Adaptadores de los generadores de prngs a interfaces estándar:
+#   NumpyBitGenerator: BitGenerator de NumPy (estructura bitgen_t con punteros ctypes a
+#       next_uint64/next_uint32/next_double/next_raw) → np.random.Generator(...) da
+#       normal, integers, shuffle, choice, ... sobre el flujo del generador. Los callbacks
+#       leen de un búfer de palabras de 32 bits que se rellena por bloques (random_array /
+#       random_uint32 del generador), no una llamada al generador por valor.
+#   PRNGRandom: subclase de random.Random (random(), getrandbits(), getstate/setstate),
+#       sin lectura anticipada: random() y getrandbits() se alternan sobre el mismo flujo.
+#   SecretsRNG: random.SystemRandom (os.urandom) serializable, para pools de procesos.
+# Convenciones de NumPy para generadores de 32 bits: next_uint64 = (w1 << 32) | w2 y
+# next_double = ((w1 >> 5)·2^26 + (w2 >> 6)) / 2^53 (con MT19937 coincide con
+# np.random.RandomState(seed).random_sample()).
+
+import ctypes
+import random
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+BLOCK = 4096    # palabras de 32 bits por relleno del búfer
+
+
+def uint32_block(gen, n: int) -> np.ndarray:
+    """
+    n palabras de 32 bits del flujo de gen: random_uint32 si existe (MT19937); palabras
+    crudas si word_range = 2^32 (LCG m=2^32, BBS); si no, randints(0, 2^32−1) (rechazo
+    sobre las palabras crudas: RANDU, MiddleSquare no dejan bits fijos ni huecos);
+    getrandbits para random.Random.
+    """
+    n = int(n)
+    if hasattr(gen, "random_uint32"):
+        return gen.random_uint32(n)
+    if hasattr(gen, "random_words"):
+        if gen.word_range == 2**32:
+            return gen.random_words(n).astype(np.uint32)
+        return gen.randints(0, 2**32 - 1, n).astype(np.uint32)
+    if hasattr(gen, "getrandbits"):
+        raw = gen.getrandbits(32 * n).to_bytes(4 * n, "little") if n else b""
+        return np.frombuffer(raw, dtype="<u4").astype(np.uint32)
+    return np.array([int(gen.random() * 2**32) for _ in range(n)], dtype=np.uint32)
+
+
+class _WordBuffer:
+    # búfer de palabras de 32 bits con relleno por bloques
+    __slots__ = ("gen", "block", "words", "pos")
+
+    def __init__(self, gen, block: int = BLOCK):
+        self.gen, self.block = gen, int(block)
+        self.words, self.pos = [], 0
+
+    def next32(self) -> int:
+        if self.pos >= len(self.words):
+            self.words, self.pos = uint32_block(self.gen, self.block).tolist(), 0
+        w = self.words[self.pos]
+        self.pos += 1
+        return w
+
+
+# ---------------- NumPy BitGenerator ----------------
+class _BitGen(ctypes.Structure):
+    # struct bitgen_t de numpy/random/bitgen.h
+    _fields_ = [("state", ctypes.c_void_p),
+                ("next_uint64", ctypes.c_void_p),
+                ("next_uint32", ctypes.c_void_p),
+                ("next_double", ctypes.c_void_p),
+                ("next_raw", ctypes.c_void_p)]
+
+
+_U64 = ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)
+_U32 = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)
+_DBL = ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)
+
+_capsule_new = ctypes.pythonapi.PyCapsule_New
+_capsule_new.restype = ctypes.py_object
+_capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+
+
+class NumpyBitGenerator:
+    """
+    BitGenerator de NumPy sobre gen (cualquier generador de prngs o random.Random):
+    np.random.Generator(NumpyBitGenerator(gen)). Expone capsule y lock como los
+    BitGenerator nativos. Los valores se toman del flujo de gen en orden (32 bits por
+    palabra); el costo por valor es un callback de Python sobre el búfer.
+    """
+
+    def __init__(self, gen, block: int = BLOCK):
+        self.gen = gen
+        self.lock = threading.Lock()
+        buf = _WordBuffer(gen, block)
+        nxt = buf.next32
+
+        def next_uint32(_):
+            return nxt()
+
+        def next_uint64(_):
+            return (nxt() << 32) | nxt()
+
+        def next_double(_):
+            return ((nxt() >> 5) * 67108864.0 + (nxt() >> 6)) / 9007199254740992.0
+
+        # referencias vivas mientras exista el adaptador (los punteros no las retienen)
+        self._buffer = buf
+        self._callbacks = (_U64(next_uint64), _U32(next_uint32), _DBL(next_double))
+        f64, f32, fd = self._callbacks
+        ptr = lambda f: ctypes.cast(f, ctypes.c_void_p)
+        self._bitgen = _BitGen(None, ptr(f64), ptr(f32), ptr(fd), ptr(f32))
+        self.capsule = _capsule_new(ctypes.addressof(self._bitgen), b"BitGenerator", None)
+
+    def random_raw(self, size: int = 1) -> np.ndarray:
+        """size palabras crudas de 32 bits (como np.uint64), del mismo búfer."""
+        with self.lock:
+            return np.array([self._buffer.next32() for _ in range(int(size))], dtype=np.uint64)
+
+
+def numpy_generator(gen, block: int = BLOCK) -> np.random.Generator:
+    """np.random.Generator que consume el flujo de gen."""
+    return np.random.Generator(NumpyBitGenerator(gen, block))
+
+
+# ---------------- random.Random ----------------
+class PRNGRandom(random.Random):
+    """
+    random.Random sobre un generador de prngs: random() es el float del generador y
+    getrandbits(k) es gen.randint(0, 2^k − 1) (rechazo sobre sus palabras crudas), así que
+    randrange/randint/choice/shuffle/sample heredados son sin sesgo. Cada llamada consume
+    solo lo que usa del flujo. seed(a) recrea el generador con factory(a) (por defecto
+    type(gen)(seed=a, **params)). Serializable si gen (y factory) lo son.
+    """
+
+    def __init__(self, gen, params: Optional[Dict[str, Any]] = None,
+                 factory: Optional[Callable[[Any], Any]] = None):
+        self._gen, self._params, self._factory = gen, dict(params or {}), factory
+        super().__init__()
+
+    def seed(self, a=None, version: int = 2) -> None:
+        # a=None (llamada de random.Random.__init__) conserva el flujo actual
+        if a is not None:
+            if self._factory is not None:
+                self._gen = self._factory(a)
+            else:
+                self._gen = type(self._gen)(seed=a, **self._params)
+        self.gauss_next = None
+
+    def random(self) -> float:
+        return self._gen.random()
+
+    def getrandbits(self, k: int) -> int:
+        k = int(k)
+        if k < 0:
+            raise ValueError("k debe ser ≥ 0.")
+        return self._gen.randint(0, (1 << k) - 1) if k else 0
+
+    def getstate(self):
+        return ("prngs", self._gen.getstate(), self.gauss_next)
+
+    def setstate(self, state) -> None:
+        tag, gstate, self.gauss_next = state
+        if tag != "prngs":
+            raise ValueError("estado no generado por PRNGRandom.getstate().")
+        self._gen.setstate(gstate)
+
+    def __reduce__(self):
+        # random.Random.__reduce__ reconstruye con cls() sin argumentos
+        return (type(self), (self._gen, self._params, self._factory), self.getstate())
+
+
+class SecretsRNG(random.SystemRandom):
+    """random.SystemRandom (entropía del SO, como secrets) serializable para procesos."""
+
+    def __reduce__(self):
+        return (type(self), ())
@@ -0,0 +1,124 @@
+# prngs/base.py
+# Interfaz común por lotes para los generadores de prngs.
+#   random_array(n) → np.ndarray float64 con n extracciones
+#   fill(buffer)    → llena un buffer float64 del llamador (ndarray, memoryview, array('d'))
+# La salida coincide bit a bit con n llamadas sucesivas a random(): lote y escalar
+# pueden mezclarse sin perder reproducibilidad.
+#   random_word() / random_words(n) → palabras crudas equiprobables en [0, word_range)
+#   randint / randints → enteros en [low, high] sin sesgo (rechazo sobre palabras crudas;
+#   el valor aceptado se mapea con sus bits altos: los bajos de un LCG tienen periodo corto)
+
+import numpy as np
+
+
+def _as_float64_view(buffer) -> np.ndarray:
+    # Vista float64 escribible sobre el buffer (sin copiar)
+    view = buffer if isinstance(buffer, np.ndarray) else np.asarray(memoryview(buffer))
+    if view.dtype != np.float64:
+        raise TypeError("el buffer debe ser de tipo float64 ('d').")
+    if not view.flags.writeable:
+        raise ValueError("el buffer debe ser escribible.")
+    return view
+
+
+class BasePRNG:
+    # Cada subclase implementa random() y, opcionalmente, _fill(out) con un bucle
+    # más rápido que llamar a random() n veces desde fuera.
+    # word_range: nº de valores equiprobables de la salida cruda (random() = palabra / word_range).
+
+    word_range = 2**32
+
+    def random(self) -> float:
+        raise NotImplementedError
+
+    def _fill(self, out: np.ndarray) -> None:
+        # Implementación genérica (lenta): una llamada a random() por elemento
+        rnd = self.random
+        for i in range(out.shape[0]):
+            out[i] = rnd()
+
+    def random_array(self, n: int) -> np.ndarray:
+        """Devuelve n valores en [0,1) como np.ndarray float64."""
+        n = int(n)
+        if n < 0:
+            raise ValueError("n debe ser ≥ 0.")
+        out = np.empty(n, dtype=np.float64)
+        if n:
+            self._fill(out)
+        return out
+
+    def fill(self, buffer) -> None:
+        """Llena buffer (float64) con len(buffer) valores en [0,1)."""
+        view = _as_float64_view(buffer)
+        if view.size == 0:
+            return
+        if view.flags.c_contiguous:
+            self._fill(view.reshape(-1))
+        else:                           # vista con saltos: se llena una copia contigua
+            tmp = np.empty(view.size, dtype=np.float64)
+            self._fill(tmp)
+            view[...] = tmp.reshape(view.shape)
+
+    def random_word(self) -> int:
+        """Una palabra cruda en [0, word_range); mismo flujo que random()."""
+        return int(round(self.random() * self.word_range))
+
+    def random_words(self, n: int) -> np.ndarray:
+        """n palabras crudas (np.uint64) en [0, word_range); mismo flujo que random_array(n)."""
+        return np.rint(self.random_array(n) * self.word_range).astype(np.uint64)
+
+    def _rejection(self, r: int):
+        # (W, k, lim, q): k palabras forman v ∈ [0, W^k) con W^k ≥ r; se acepta v < lim
+        # (lim múltiplo de r) y se devuelve v // q, q = lim/r (bits altos de v)
+        if r < 1:
+            raise ValueError("se requiere low ≤ high.")
+        W = int(self.word_range)
+        k, span = 1, W
+        while span < r:
+            k, span = k + 1, span * W
+        lim = span - span % r
+        return W, k, lim, lim // r
+
+    def randints(self, low: int, high: int, size: int) -> np.ndarray:
+        """
+        size enteros uniformes en [low, high] sin sesgo: se combinan k palabras en
+        v ∈ [0, W^k) con W^k ≥ r = high−low+1, se rechaza v ≥ W^k − (W^k mod r) y el
+        aceptado se mapea a v // (lim/r). Misma secuencia que size llamadas a randint().
+        """
+        low, high, size = int(low), int(high), int(size)
+        r = high - low + 1
+        W, k, lim, q = self._rejection(r)
+        small = W**k < 2**63 and abs(low) + r < 2**63
+        parts, need = [], size
+        while need:                      # cada ronda pide exactamente los que faltan
+            w = self.random_words(need * k).reshape(need, k)
+            w = w.astype(np.int64) if small else w.astype(object)
+            v = w[:, 0]
+            for j in range(1, k):
+                v = v * W + w[:, j]
+            v = v[v < lim]
+            parts.append(v // q)
+            need -= v.size
+        out = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64 if small else object)
+        return out + low
+
+    def randint(self, low: int, high: int) -> int:
+        """Entero uniforme en [low, high] (sin sesgo de discretización); escalar, sin NumPy."""
+        low, high = int(low), int(high)
+        r = high - low + 1
+        W = self.word_range
+        word = self.random_word
+        if 0 < r <= W:                   # caso usual: una palabra por candidato
+            lim = W - W % r
+            q = lim // r
+            v = word()
+            while v >= lim:
+                v = word()
+            return low + v // q
+        W, k, lim, q = self._rejection(int(r))
+        while True:
+            v = word()
+            for _ in range(k - 1):
+                v = v * W + word()
+            if v < lim:
+                return low + v // q
@@ -1,12 +1,65 @@
-class BlumBlumShub:
-    # BBS — X_{k+1} = X_k^2 mod M, M = p*q con p≡q≡3 (mod 4). Uso demostrativo (M pequeño).
-    def __init__(self, seed: int = 8731, p: int = 383, q: int = 503):
+import math
+import secrets
+
+from .base import BasePRNG
+
+
+def _is_probable_prime(n: int, rounds: int = 40) -> bool:
+    # Miller–Rabin con bases aleatorias (secrets)
+    if n < 2:
+        return False
+    for sp in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if n % sp == 0:
+            return n == sp
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for _ in range(rounds):
+        a = 2 + secrets.randbelow(n - 3)
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def blum_prime(bits: int) -> int:
+    """Primo aleatorio de 'bits' bits con p ≡ 3 (mod 4) (primo de Blum)."""
+    bits = int(bits)
+    if bits < 8:
+        raise ValueError("bits debe ser ≥ 8.")
+    while True:
+        n = secrets.randbits(bits) | (1 << (bits - 1)) | 3
+        if _is_probable_prime(n):
+            return n
+
+
+class BlumBlumShub(BasePRNG):
+    # BBS — X_{k+1} = X_k^2 mod M, M = p*q con p≡q≡3 (mod 4). Por defecto M pequeño (demostrativo);
+    # with_key_size() genera módulos de 1024–4096 bits.
+    # Extracción: bits_per_step bits bajos por cuadrado (seguro hasta ⌊log2 log2 M⌋).
+    # Acceso directo: X_i = X_0^(2^i) mod M por CRT: en cada primo el exponente 2^i se
+    # reduce mod p−1 (resp. q−1) por Fermat y los dos residuos se combinan.
+    def __init__(self, seed: int = 8731, p: int = 383, q: int = 503, bits_per_step: int = 1):
         # Validación de primos de Blum
         if p == q or p % 4 != 3 or q % 4 != 3:
             raise ValueError("p y q deben ser primos distintos con p≡q≡3 (mod 4).")
         self.p, self.q = int(p), int(q)
         self.M = self.p * self.q  # módulo compuesto
 
+        # Bits extraídos por cuadrado: 1 ≤ k ≤ ⌊log2 log2 M⌋
+        k = int(bits_per_step)
+        if not 1 <= k <= self.max_bits_per_step:
+            raise ValueError(f"bits_per_step debe estar en [1, {self.max_bits_per_step}] "
+                             f"(⌊log2 log2 M⌋ para M de {self.M.bit_length()} bits).")
+        self.k = k
+
         # Semilla: 0 < x0 < M y coprima con M (evitar múltiplos de p o q)
         x0 = int(seed) % self.M
         if x0 == 0:
@@ -18,19 +71,77 @@ class BlumBlumShub:
 
         # Estado inicial: X0 = x0^2 mod M (definición estándar)
         self.state = pow(x0, 2, self.M)
+        self.x0 = self.state      # X_0 (para acceso directo)
+        self.pos = 0              # nº de cuadrados aplicados desde X_0
+
+    @classmethod
+    def with_key_size(cls, bits: int = 2048, seed: int = None, bits_per_step: int = None):
+        # Módulo de 'bits' bits con primos de Blum aleatorios de bits/2 cada uno.
+        # bits_per_step por defecto: máximo seguro ⌊log2 log2 M⌋.
+        half = int(bits) // 2
+        p = blum_prime(half)
+        q = blum_prime(half)
+        while q == p:
+            q = blum_prime(half)
+        if seed is None:
+            seed = secrets.randbits(int(bits))
+        if bits_per_step is None:
+            bits_per_step = int(math.log2(math.log2(p * q)))
+        return cls(seed=seed, p=p, q=q, bits_per_step=bits_per_step)
+
+    @property
+    def max_bits_per_step(self) -> int:
+        return max(1, int(math.log2(math.log2(self.M))))
+
+    def state_at(self, i: int) -> int:
+        # X_i sin iterar: exponente 2^i reducido mod (p−1) y (q−1), luego CRT
+        i = int(i)
+        if i < 0:
+            raise ValueError("i debe ser ≥ 0.")
+        p, q = self.p, self.q
+        xp = pow(self.x0 % p, pow(2, i, p - 1), p)
+        xq = pow(self.x0 % q, pow(2, i, q - 1), q)
+        return xq + q * ((xp - xq) * pow(q, -1, p) % p)
+
+    def seek(self, i: int) -> None:
+        # Posiciona el generador en X_i (el siguiente cuadrado produce X_{i+1})
+        self.state = self.state_at(i)
+        self.pos = int(i)
+
+    def getstate(self):
+        # Instantánea (X_i, i) restaurable con setstate
+        return (self.state, self.pos)
+
+    def setstate(self, state) -> None:
+        self.state, self.pos = int(state[0]), int(state[1])
 
     def _next_bit(self) -> int:
         # Iteración cuadrática y extracción del bit menos significativo
         self.state = pow(self.state, 2, self.M)
+        self.pos += 1
         return self.state & 1
 
     def random(self, bits: int = 32) -> float:
-        # Empaquetado de 'bits' LSB sucesivos en un entero y escalado a [0,1)
-        x = 0
-        for _ in range(int(bits)):
-            x = (x << 1) | self._next_bit()
-        return x / (1 << bits)
-
-    def randint(self, low: int, high: int) -> int:
-        # Entero en [low, high] vía escala de random(); posible sesgo mínimo por discretización
-        return low + int(self.random() * (high - low + 1))
+        # Empaquetado de 'bits' bits sucesivos (k por cuadrado) en un entero y escalado a [0,1)
+        bits = int(bits)
+        M, k, x = self.M, self.k, self.state
+        mask, steps = (1 << k) - 1, -(-bits // k)
+        v = 0
+        for _ in range(steps):
+            x = x * x % M
+            v = (v << k) | (x & mask)
+        self.state, self.pos = x, self.pos + steps
+        return (v >> (steps * k - bits)) / (1 << bits)
+
+    def _fill(self, out, bits: int = 32) -> None:
+        # Igual que random(bits) en bucle, con el cuadrado modular en local
+        M, k, x, bits = self.M, self.k, self.state, int(bits)
+        mask, steps = (1 << k) - 1, -(-bits // k)
+        drop, scale = steps * k - bits, 1 << bits
+        for i in range(out.shape[0]):
+            v = 0
+            for _ in range(steps):
+                x = x * x % M
+                v = (v << k) | (x & mask)
+            out[i] = (v >> drop) / scale
+        self.state, self.pos = x, self.pos + steps * out.shape[0]
@@ -0,0 +1,163 @@
+# prngs/cache.py
+# Caché persistente de flujos generados, en out/cache/streams/.
+#   Clave: (clase del generador, parámetros del constructor, semilla, tipo de salida).
+#   El flujo se guarda en segmentos alineados de 'segment' valores (archivos crudos
+#   float64 = random_array, o uint32 = palabras crudas random_words, para generadores con
+#   word_range ≤ 2^32) y se lee con np.memmap: una lectura dentro de un segmento es un
+#   slice sin copia. Desalojo LRU (por mtime, que se renueva en cada acceso) cuando el
+#   tamaño total supera max_bytes (se revisa solo después de escribir segmentos).
+#   CachedStream: adaptador random()/random_array()/jump() que lee el flujo desde la caché;
+#   random() sirve desde un bloque leído de una vez (sin un get() por valor).
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List
+
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'out', 'cache', 'streams')
+
+_KINDS = {"float64": np.float64, "uint32": np.uint32}
+
+
+class StreamCache:
+    def __init__(self, root: str = CACHE_DIR, max_bytes: int = 2 * 1024**3, segment: int = 1 << 18):
+        self.root = root
+        self.max_bytes = int(max_bytes)
+        self.segment = int(segment)
+
+    # ---------------- claves y rutas ----------------
+    def key(self, cls: type, params: Dict[str, Any], seed: int, kind: str = "float64") -> str:
+        if kind not in _KINDS:
+            raise ValueError(f"kind debe ser uno de {sorted(_KINDS)}.")
+        desc = {"cls": f"{cls.__module__}.{cls.__qualname__}", "params": params or {},
+                "seed": int(seed), "kind": kind, "segment": self.segment}
+        digest = hashlib.sha1(json.dumps(desc, sort_keys=True).encode()).hexdigest()[:20]
+        meta = os.path.join(self.root, digest + ".json")
+        if not os.path.exists(meta):             # descripción legible de la clave
+            os.makedirs(self.root, exist_ok=True)
+            with open(meta, "w", encoding="utf-8") as f:
+                json.dump(desc, f, indent=2)
+        return digest
+
+    def _path(self, key: str, idx: int, kind: str) -> str:
+        return os.path.join(self.root, f"{key}_{idx}.{kind}")
+
+    # ---------------- generación ----------------
+    def _generator(self, cls: type, params: Dict[str, Any], seed: int, offset: int):
+        g = cls(seed=seed, **(params or {}))
+        if offset:
+            if hasattr(g, "jump"):
+                g.jump(offset)
+            else:                                # sin salto: se descartan valores por bloques
+                left = offset
+                while left:
+                    k = min(left, self.segment)
+                    g.random_array(k)
+                    left -= k
+        return g
+
+    def _write_segment(self, g, path: str, kind: str) -> None:
+        if kind == "float64":
+            data = g.random_array(self.segment)
+        else:
+            if int(g.word_range) > 2**32:
+                raise ValueError(f"kind='uint32' requiere word_range ≤ 2^32 "
+                                 f"({type(g).__name__}: {g.word_range}).")
+            data = g.random_words(self.segment).astype(np.uint32)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        data.tofile(tmp)
+        os.replace(tmp, path)                    # escritura atómica
+
+    # ---------------- lectura ----------------
+    def get(self, cls: type, params: Dict[str, Any], seed: int, offset: int, n: int,
+            kind: str = "float64") -> np.ndarray:
+        """
+        Valores [offset, offset+n) del flujo de cls(seed=seed, **params). Genera y guarda
+        los segmentos que falten. Dentro de un solo segmento: vista memmap (sin copia).
+        """
+        key = self.key(cls, params, seed, kind)
+        offset, n = int(offset), int(n)
+        if n <= 0:
+            return np.empty(0, dtype=_KINDS[kind])
+        first, last = offset // self.segment, (offset + n - 1) // self.segment
+
+        g = None                                 # generador posicionado en el siguiente faltante
+        wrote = False
+        for idx in range(first, last + 1):
+            path = self._path(key, idx, kind)
+            if os.path.exists(path):
+                g = None
+                continue
+            if g is None:
+                g = self._generator(cls, params, seed, idx * self.segment)
+            self._write_segment(g, path, kind)
+            wrote = True
+
+        parts: List[np.ndarray] = []
+        for idx in range(first, last + 1):
+            path = self._path(key, idx, kind)
+            os.utime(path)                       # LRU: marca de acceso
+            mm = np.memmap(path, dtype=_KINDS[kind], mode="r", shape=(self.segment,))
+            lo = max(offset - idx * self.segment, 0)
+            hi = min(offset + n - idx * self.segment, self.segment)
+            parts.append(mm[lo:hi])
+        if wrote:
+            self.evict()
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    # ---------------- desalojo ----------------
+    def size(self) -> int:
+        if not os.path.isdir(self.root):
+            return 0
+        return sum(e.stat().st_size for e in os.scandir(self.root) if e.name.endswith(tuple(_KINDS)))
+
+    def evict(self) -> List[str]:
+        """Borra segmentos menos recientemente usados hasta quedar en max_bytes."""
+        if not os.path.isdir(self.root):
+            return []
+        files = [e for e in os.scandir(self.root) if e.name.endswith(tuple(_KINDS))]
+        total = sum(e.stat().st_size for e in files)
+        removed = []
+        for e in sorted(files, key=lambda e: e.stat().st_mtime):
+            if total <= self.max_bytes:
+                break
+            total -= e.stat().st_size
+            os.remove(e.path)
+            removed.append(e.path)
+        return removed
+
+
+class CachedStream:
+    """
+    Adaptador de lectura secuencial (random(), random_array(n), jump(k)) sobre el flujo
+    cacheado de cls(seed=seed, **params) a partir de 'offset'. Misma secuencia que el
+    generador real; serializable (para procesos) y copiable. random() lee bloques de
+    hasta 'block' valores (sin pasar del segmento actual) y los sirve como floats.
+    """
+
+    def __init__(self, cache: StreamCache, cls: type, params: Dict[str, Any], seed: int,
+                 offset: int = 0, block: int = 4096):
+        self.cache, self.cls, self.params, self.seed = cache, cls, dict(params or {}), int(seed)
+        self.pos = int(offset)
+        self.block = int(block)
+        self._buf, self._start = [], 0           # valores [_start, _start + len(_buf))
+
+    def random_array(self, n: int) -> np.ndarray:
+        out = self.cache.get(self.cls, self.params, self.seed, self.pos, n)
+        self.pos += int(n)
+        return out
+
+    def random(self) -> float:
+        i = self.pos - self._start
+        if not 0 <= i < len(self._buf):
+            seg = self.cache.segment
+            k = min(self.block, seg - self.pos % seg)
+            self._buf = self.cache.get(self.cls, self.params, self.seed, self.pos, k).tolist()
+            self._start, i = self.pos, 0
+        self.pos += 1
+        return self._buf[i]
+
+    def jump(self, k: int) -> None:
+        self.pos += int(k)
@@ -1,4 +1,71 @@
-class LCG:
+import copy
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from .base import BasePRNG
+
+LEAP_K = 4096   # tamaño de bloque del salto múltiple (leapfrog)
+
+
+def affine_pow(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    # Composición k veces del mapa afín x ↦ a·x + c (mod m) por cuadrado-y-multiplica:
+    #   x_{n+k} = A·x_n + C con A = a^k, C = c·(a^k − 1)/(a − 1)  (mod m)
+    # Se evita dividir por (a−1) (no siempre invertible mod m): O(log k) composiciones.
+    k = int(k)
+    if k < 0:
+        raise ValueError("k debe ser ≥ 0.")
+    A, C = 1, 0                   # acumulado (identidad)
+    g, h = a % m, c % m           # mapa elevado a 2^j
+    while k:
+        if k & 1:
+            A, C = (g * A) % m, (g * C + h) % m
+        g, h = (g * g) % m, (g * h + h) % m
+        k >>= 1
+    return A, C
+
+
+def spawn_stride(span: int, n_streams: int) -> int:
+    # Distancia por defecto entre subflujos: ⌊span/n⌋ redondeada a impar hacia abajo.
+    # Con m = 2^e, una distancia con muchos factores 2 da a^stride ≡ 1 (mod 2^k) con k
+    # grande: los subflujos serían traslaciones (casi) fijas del primero. Impar ⇒ A − 1
+    # tiene la valuación 2-ádica de a − 1 (mínima). Hacia abajo ⇒ n·stride ≤ span (disjuntos).
+    stride = int(span) // int(n_streams)
+    if stride > 1 and stride % 2 == 0:
+        stride -= 1
+    return stride
+
+
+@lru_cache(maxsize=16)
+def leapfrog_coeffs(a: int, c: int, m: int, K: int = LEAP_K) -> Tuple[np.ndarray, np.ndarray]:
+    # Coeficientes de 1..K pasos: x_{n+j} = A_j·x_n + C_j (mod m), j = 1..K
+    # (A_j = a^j, C_j = c·(a^{j-1} + ... + 1)), en uint64; requiere m ≤ 2^32.
+    A, C = np.empty(K, dtype=np.uint64), np.empty(K, dtype=np.uint64)
+    x, y = 1, 0
+    for j in range(K):
+        x, y = (a * x) % m, (a * y + c) % m
+        A[j], C[j] = x, y
+    A.flags.writeable = C.flags.writeable = False
+    return A, C
+
+
+def leapfrog_fill(out: np.ndarray, state: int, a: int, c: int, m: int, K: int = LEAP_K) -> int:
+    # Llena out con U_k = X_k / m por bloques de K estados: cada bloque es una sola
+    # multiplicación-suma vectorizada mod m desde el último estado del bloque previo.
+    # Exacto en uint64: A_j, x < m ≤ 2^32 → A_j·x + C_j < 2^64. Devuelve el estado final.
+    A, C = leapfrog_coeffs(a, c, m, K)
+    mm, pos, total = np.uint64(m), 0, out.shape[0]
+    while pos < total:
+        k = min(K, total - pos)
+        xs = (A[:k] * np.uint64(state) + C[:k]) % mm
+        out[pos:pos + k] = xs / m
+        state = int(xs[-1])
+        pos += k
+    return state
+
+
+class LCG(BasePRNG):
     # LCG — Generador Congruencial Lineal
     # Recurrencia: X_{k+1} = (a*X_k + c) mod m ; salida U = X_k / m ∈ [0,1)
     # Parámetros por defecto (32-bit): m=2^32, a=1664525, c=1013904223
@@ -18,6 +85,50 @@ class LCG:
         self.state = (self.a * self.state + self.c) % self.m
         return self.state / self.m
 
-    def randint(self, low: int, high: int) -> int:
-        # Entero en [low, high] vía escala de random(); posible sesgo por discretización
-        return low + int(self.random() * (high - low + 1))
+    def _fill(self, out) -> None:
+        # Bloques vectorizados (leapfrog) si m ≤ 2^32; misma secuencia que random()
+        if self.m <= 2**32:
+            self.state = leapfrog_fill(out, self.state, self.a, self.c, self.m)
+            return
+        a, c, m, x = self.a, self.c, self.m, self.state
+        for i in range(out.shape[0]):
+            x = (a * x + c) % m
+            out[i] = x / m
+        self.state = x
+
+    def jump(self, k: int) -> None:
+        # Avanza el estado k pasos en O(log k) (equivale a k llamadas a random())
+        A, C = affine_pow(self.a, self.c, self.m, k)
+        self.state = (A * self.state + C) % self.m
+
+    def spawn(self, n_streams: int, stride: int = None) -> List["LCG"]:
+        # Divide el flujo en n_streams subflujos disjuntos: el i-ésimo empieza en el
+        # estado actual avanzado i·stride pasos (por defecto spawn_stride(m, n_streams):
+        # ≈ m / n_streams, impar; periodo completo bajo Hull–Dobell). El generador
+        # original no se modifica.
+        n_streams = int(n_streams)
+        if n_streams < 1:
+            raise ValueError("n_streams debe ser ≥ 1.")
+        stride = spawn_stride(self.m, n_streams) if stride is None else int(stride)
+        streams = []
+        for i in range(n_streams):
+            g = copy.copy(self)
+            g.jump(i * stride)
+            streams.append(g)
+        return streams
+
+    def getstate(self) -> int:
+        # Instantánea del estado interno (restaurable con setstate)
+        return self.state
+
+    def setstate(self, state: int) -> None:
+        self.state = int(state)
+
+    @property
+    def word_range(self) -> int:
+        # palabra cruda = estado X_k ∈ [0, m)
+        return self.m
+
+    def random_word(self) -> int:
+        self.state = (self.a * self.state + self.c) % self.m
+        return self.state
@@ -1,4 +1,7 @@
-class MiddleSquare:
+from .base import BasePRNG
+
+
+class MiddleSquare(BasePRNG):
     # Middle-Square (von Neumann)
     # Recurrencia: S_{k+1} = mid_n(S_k^2) ; salida U = S_k / 10^n ∈ [0,1)
     # Limitaciones: periodos muy cortos; ciclos/0 (uso educativo).
@@ -19,6 +22,24 @@ class MiddleSquare:
         self.state = int(core)               # puede colapsar a 0 (comportamiento esperado)
         return self.state / (10 ** self.n)
 
-    def randint(self, low: int, high: int) -> int:
-        # Entero en [low, high] vía escala de random()
-        return low + int(self.random() * (high - low + 1))
+    def _fill(self, out) -> None:
+        # Versión aritmética de random(): como S < 10^n, S^2 tiene ≤ 2n dígitos y los
+        # n centrales (con padding a 2n) son (S^2 // 10^(n/2)) mod 10^n.
+        half, mod = 10 ** (self.n // 2), 10 ** self.n
+        x = self.state
+        for i in range(out.shape[0]):
+            x = (x * x // half) % mod
+            out[i] = x / mod
+        self.state = x
+
+    def getstate(self) -> int:
+        # Instantánea del estado interno (restaurable con setstate)
+        return self.state
+
+    def setstate(self, state: int) -> None:
+        self.state = int(state)
+
+    @property
+    def word_range(self) -> int:
+        # palabra cruda = estado S_k ∈ [0, 10^n)
+        return 10 ** self.n
@@ -1,4 +1,12 @@
-class MT19937:
+import copy
+from typing import List
+
+import numpy as np
+
+from .base import BasePRNG
+
+
+class MT19937(BasePRNG):
     """
     Mersenne Twister (MT19937)
     - Periodo: 2^19937 - 1 (no criptográfico).
@@ -8,6 +16,9 @@ class MT19937:
       a=0x9908B0DF (matriz A en twist)
       u=11,d=0xFFFFFFFF ; s=7,b=0x9D2C5680 ; t=15,c=0xEFC60000 ; l=18  (tempering)
       f=1812433253 (inicialización del estado)
+    Motor NumPy: el twist se hace por segmentos vectorizados y el tempering se
+    aplica al bloque completo de 624 palabras; extract_number()/random() leen del
+    bloque ya templado. Salida idéntica a la implementación de referencia en C.
     """
 
     # parámetros MT19937
@@ -23,45 +34,132 @@ class MT19937:
     lower_mask = (1 << r) - 1
     upper_mask = ((1 << w) - 1) & ~lower_mask
 
+    # saltos más cortos se hacen generando y descartando bloques (más barato que el polinomio)
+    JUMP_MIN = 1 << 20
+
     def __init__(self, seed: int = 5489):
-        self.MT = [0] * self.n         # buffer de estado
+        self.MT = np.zeros(self.n, dtype=np.uint32)     # buffer de estado
+        self._block = np.zeros(self.n, dtype=np.uint32)  # salidas templadas del bloque actual
         self.index = self.n             # fuerza twist en primera extracción
         self.seed(seed)
 
     def seed(self, seed: int) -> None:
-        # expansión de semilla al estado completo
+        # expansión de semilla al estado completo (recurrencia serial; en enteros Python)
         self.index = self.n
-        self.MT[0] = seed & 0xFFFFFFFF
+        mt = [int(seed) & 0xFFFFFFFF]
         for i in range(1, self.n):
-            x = self.MT[i-1] ^ (self.MT[i-1] >> (self.w - 2))
-            self.MT[i] = (self.f * x + i) & 0xFFFFFFFF
+            x = mt[i-1] ^ (mt[i-1] >> (self.w - 2))
+            mt.append((self.f * x + i) & 0xFFFFFFFF)
+        self.MT[:] = mt
+
+    def _mix(self, hi, lo, far):
+        # far ^ (x >> 1) ^ (A si LSB(x)=1), con x = bits altos de hi | bits bajos de lo
+        x = (hi & np.uint32(self.upper_mask)) | (lo & np.uint32(self.lower_mask))
+        return far ^ (x >> np.uint32(1)) ^ ((x & np.uint32(1)) * np.uint32(self.a))
 
     def twist(self) -> None:
-        # regeneración del bloque de 624 valores crudos
-        for i in range(self.n):
-            x  = (self.MT[i] & self.upper_mask) + (self.MT[(i+1) % self.n] & self.lower_mask)
-            xA = x >> 1
-            if x & 1:                   # si LSB=1, mezclar con A
-                xA ^= self.a
-            self.MT[i] = self.MT[(i + self.m) % self.n] ^ xA
+        # regeneración del bloque de 624 valores crudos en tres tramos:
+        #   i = 0..226    : MT[i+m] aún es del bloque anterior → un solo slice
+        #   i = 227..622  : MT[i-227] ya es nuevo → slices de 227 (dependencia a distancia n-m)
+        #   i = 623       : vuelta circular con MT[0] (nuevo)
+        mt, n, m = self.MT, self.n, self.m
+        k = n - m
+        mt[:k] = self._mix(mt[:k], mt[1:k+1], mt[m:])
+        for lo in range(k, n - 1, k):
+            hi = min(lo + k, n - 1)
+            mt[lo:hi] = self._mix(mt[lo:hi], mt[lo+1:hi+1], mt[lo-k:hi-k])
+        mt[n-1:] = self._mix(mt[n-1:], mt[:1], mt[m-1:m])
+        self._block = self._temper(mt)
         self.index = 0
 
+    def _temper(self, y: np.ndarray) -> np.ndarray:
+        # tempering vectorizado sobre todo el bloque
+        y = y ^ ((y >> np.uint32(self.u)) & np.uint32(self.d))
+        y ^= (y << np.uint32(self.s)) & np.uint32(self.b)
+        y ^= (y << np.uint32(self.t)) & np.uint32(self.c)
+        y ^= y >> np.uint32(self.l)
+        return y
+
     def extract_number(self) -> int:
-        # extracción de entero 32-bit con tempering
+        # extracción de entero 32-bit ya templado
         if self.index >= self.n:
             self.twist()
-        y = self.MT[self.index]
-        y ^= (y >> self.u) & self.d
-        y ^= (y << self.s) & self.b
-        y ^= (y << self.t) & self.c
-        y ^= (y >> self.l)
+        y = self._block[self.index]
         self.index += 1
-        return y & 0xFFFFFFFF
+        return int(y)
+
+    def _take(self, out: np.ndarray, scale: float = 0.0) -> None:
+        # copia bloques templados a out (uint32 tal cual, o float64 dividido por 2^32)
+        pos, total = 0, out.shape[0]
+        while pos < total:
+            if self.index >= self.n:
+                self.twist()
+            k = min(total - pos, self.n - self.index)
+            chunk = self._block[self.index:self.index + k]
+            out[pos:pos + k] = chunk / scale if scale else chunk
+            self.index += k
+            pos += k
+
+    def random_uint32(self, n: int) -> np.ndarray:
+        """Devuelve n enteros de 32 bits (np.uint32), mismo flujo que extract_number()."""
+        out = np.empty(int(n), dtype=np.uint32)
+        self._take(out)
+        return out
+
+    def getstate(self):
+        # Instantánea (bloque de 624 palabras crudas, índice) restaurable con setstate
+        return (self.MT.tobytes(), self.index)
+
+    def setstate(self, state) -> None:
+        words, index = state
+        self.MT = np.frombuffer(words, dtype=np.uint32).copy()
+        self._block = self._temper(self.MT)
+        self.index = int(index)
+
+    def jump(self, steps: int = 2**128) -> None:
+        # Avanza 'steps' salidas sin generarlas (polinomio de salto sobre GF(2), ver
+        # mt_jump). El bloque MT es la ventana de las 624 palabras crudas más recientes;
+        # se salta la ventana y se conserva el índice dentro del bloque.
+        steps = int(steps)
+        if steps < self.JUMP_MIN:
+            if steps < 0:
+                raise ValueError("steps debe ser ≥ 0.")
+            left = steps                # ~steps/624 twists (sin templar la salida)
+            while left:
+                if self.index >= self.n:
+                    self.twist()
+                k = min(left, self.n - self.index)
+                self.index += k
+                left -= k
+            return
+        from .mt_jump import jump_window
+        self.MT = jump_window(self.MT, steps)
+        self._block = self._temper(self.MT)
+
+    def spawn(self, n: int, steps: int = 2**128) -> List["MT19937"]:
+        # n generadores en desplazamientos disjuntos 0, steps, 2·steps, ... desde el
+        # estado actual. El generador original no se modifica.
+        n = int(n)
+        if n < 1:
+            raise ValueError("n debe ser ≥ 1.")
+        streams = [copy.deepcopy(self)]
+        for _ in range(n - 1):
+            g = copy.deepcopy(streams[-1])
+            g.jump(steps)
+            streams.append(g)
+        return streams
 
     def random(self) -> float:
         # float ∈ [0,1)
         return self.extract_number() / 2**32
 
-    def randint(self, low: int, high: int) -> int:
-        # entero en [low, high] (posible sesgo mínimo por discretización)
-        return low + int(self.random() * (high - low + 1))
+    def _fill(self, out) -> None:
+        # extracción por bloques; mismo flujo que random()
+        self._take(out, scale=2**32)
+
+    def random_word(self) -> int:
+        return self.extract_number()
+
+    def random_words(self, n: int) -> np.ndarray:
+        # palabras crudas = salidas templadas de 32 bits
+        return self.random_uint32(n).astype(np.uint64)
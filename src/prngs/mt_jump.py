@@ -0,0 +1,160 @@
+# prngs/mt_jump.py
+# Salto (jump-ahead) para MT19937 por polinomios sobre GF(2).
+#   φ(t): polinomio característico de la recurrencia (grado 19937), vía Berlekamp–Massey
+#   h(t) = t^(J-1) mod φ(t)  → F^J·W = h(F)·(F·W)   (Horner: 19937 pasos, sin generar J salidas)
+# W es la ventana de las 624 palabras crudas más recientes (el bloque MT tal cual);
+# F avanza la ventana una palabra. Se aplica h sobre F·W porque la palabra más antigua
+# de W aporta 31 bits bajos que F descarta (núcleo de F); en la imagen de F el
+# polinomio mínimo es exactamente φ.
+# φ y los h de distancias fijas (PERSIST_STEPS: el 2^128 de spawn) se calculan una sola
+# vez y se guardan en out/cache/ (hex); los h de otras distancias solo se memorizan en
+# el proceso (LRU acotado), para no dejar un archivo por cada distancia usada.
+
+import functools
+import os
+from typing import Dict
+
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'out', 'cache')
+
+_N, _M = 624, 397
+_UPPER, _LOWER, _A = 0x80000000, 0x7FFFFFFF, 0x9908B0DF
+_DEG = 19937
+
+PERSIST_STEPS = frozenset({2**128})
+
+_memo: Dict[str, int] = {}
+
+# tablas para elevar al cuadrado en GF(2)[t]: cada nibble 'abcd' → '0a0b0c0d'
+_SPREAD_LO = bytes(sum(((b >> i) & 1) << (2 * i) for i in range(4)) for b in range(256))
+_SPREAD_HI = bytes(sum(((b >> (i + 4)) & 1) << (2 * i) for i in range(4)) for b in range(256))
+
+
+# ---------------- Caché en disco ----------------
+def _load_or_compute(name: str, compute, cache_dir: str = None) -> int:
+    if name in _memo:
+        return _memo[name]
+    path = os.path.join(cache_dir or CACHE_DIR, name + ".hex")
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            value = int(f.read().strip(), 16)
+    except (OSError, ValueError):
+        value = compute()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="ascii") as f:
+            f.write(f"{value:x}\n")
+        os.replace(tmp, path)                 # escritura atómica (varios procesos)
+    _memo[name] = value
+    return value
+
+
+# ---------------- Aritmética en GF(2)[t] (polinomios como int) ----------------
+def _gf2_square(a: int) -> int:
+    # (Σ a_i t^i)^2 = Σ a_i t^(2i): intercala ceros entre bits
+    if a == 0:
+        return 0
+    b = a.to_bytes((a.bit_length() + 7) // 8, "little")
+    out = bytearray(2 * len(b))
+    out[0::2] = b.translate(_SPREAD_LO)
+    out[1::2] = b.translate(_SPREAD_HI)
+    return int.from_bytes(out, "little")
+
+
+def _gf2_mod(a: int, p: int) -> int:
+    dp = p.bit_length() - 1
+    while True:
+        da = a.bit_length() - 1
+        if da < dp:
+            return a
+        a ^= p << (da - dp)
+
+
+def _gf2_powmod_t(e: int, p: int) -> int:
+    # t^e mod p, binario de izquierda a derecha (multiplicar por t = desplazar)
+    r = 1
+    for bit in bin(e)[2:]:
+        r = _gf2_mod(_gf2_square(r), p)
+        if bit == "1":
+            r = _gf2_mod(r << 1, p)
+    return r
+
+
+def _berlekamp_massey(bits) -> int:
+    # Polinomio de conexión C(x) (bit i = c_i) de la secuencia binaria; devuelve el
+    # polinomio característico t^L·C(1/t).
+    C, B, L, shift = 1, 1, 0, 1
+    window = 0                          # bit i = s_{n-i}
+    for n, s in enumerate(bits):
+        window = (window << 1) | s
+        if (C & window).bit_count() & 1:
+            T = C
+            C ^= B << shift
+            if 2 * L <= n:
+                L, B, shift = n + 1 - L, T, 1
+            else:
+                shift += 1
+        else:
+            shift += 1
+    return int(format(C, f"0{L + 1}b")[::-1], 2)
+
+
+# ---------------- Polinomios de MT19937 ----------------
+def _compute_charpoly() -> int:
+    from .mt19937 import MT19937
+    g = MT19937(seed=5489)
+    bits = []
+    while len(bits) < 2 * _DEG:
+        g.twist()                       # palabras crudas (lineales en el estado)
+        bits.extend((g.MT & 1).tolist())
+    phi = _berlekamp_massey(bits[:2 * _DEG])
+    if phi.bit_length() - 1 != _DEG:
+        raise RuntimeError("Berlekamp–Massey no devolvió un polinomio de grado 19937.")
+    return phi
+
+
+def charpoly(cache_dir: str = None) -> int:
+    """Polinomio característico φ(t) de MT19937 (bit i = coeficiente de t^i)."""
+    return _load_or_compute("mt19937_charpoly", _compute_charpoly, cache_dir)
+
+
+def jump_poly(steps: int, cache_dir: str = None) -> int:
+    """h(t) = t^(steps-1) mod φ(t): F^steps·W = h(F)·(F·W)."""
+    steps = int(steps)
+    if steps < 1:
+        raise ValueError("steps debe ser ≥ 1.")
+    phi = charpoly(cache_dir)
+    if steps in PERSIST_STEPS:
+        return _load_or_compute(f"mt19937_jump_{steps:x}",
+                                lambda: _gf2_powmod_t(steps - 1, phi), cache_dir)
+    return _jump_poly_mem(steps, phi)
+
+
+@functools.lru_cache(maxsize=32)
+def _jump_poly_mem(steps: int, phi: int) -> int:
+    return _gf2_powmod_t(steps - 1, phi)
+
+
+# ---------------- Aplicación sobre la ventana ----------------
+def _step(buf: np.ndarray, p: int) -> None:
+    # F sobre la ventana circular buf (palabra más antigua en p)
+    y = (int(buf[p]) & _UPPER) | (int(buf[(p + 1) % _N]) & _LOWER)
+    buf[p] = int(buf[(p + _M) % _N]) ^ (y >> 1) ^ (_A if y & 1 else 0)
+
+
+def jump_window(window: np.ndarray, steps: int, cache_dir: str = None) -> np.ndarray:
+    """Ventana de 624 palabras crudas avanzada 'steps' palabras (uint32)."""
+    h = jump_poly(steps, cache_dir)
+    x = np.array(window, dtype=np.uint32)
+    _step(x, 0)
+    x = np.roll(x, -1)                  # X = F·W, alineada (más antigua en 0)
+    acc = np.zeros(_N, dtype=np.uint32)
+    p = 0
+    for i in range(h.bit_length() - 1, -1, -1):   # Horner: acc = F·acc ⊕ h_i·X
+        _step(acc, p)
+        p = (p + 1) % _N
+        if (h >> i) & 1:
+            acc[p:] ^= x[:_N - p]
+            acc[:p] ^= x[_N - p:]
+    return np.roll(acc, -p)
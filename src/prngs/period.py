@@ -0,0 +1,182 @@
+# prngs/period.py
+# Análisis de periodo de los generadores de prngs.
+#   - Detección de ciclos sobre el estado interno: Brent (memoria constante) o
+#     tabla hash (memoria O(μ+λ), exacto en una pasada).
+#   - Resultado: cola μ y ciclo λ medidos, o una cota inferior si se agota el presupuesto.
+#   - LCG/RANDU: verificación analítica (Hull–Dobell / periodo máximo multiplicativo).
+
+import copy
+import math
+from typing import Any, Callable, Dict, List, Tuple
+
+from .bbs import BlumBlumShub
+from .lcg import LCG
+from .middle_square import MiddleSquare
+from .mt19937 import MT19937
+from .randu import RANDU
+
+# (paso de estado, clave comparable del estado) por clase
+_STEP_KEY: Dict[type, Tuple[Callable, Callable]] = {
+    LCG:          (lambda g: g.random(),         lambda g: g.state),
+    RANDU:        (lambda g: g.random(),         lambda g: g.state),
+    MiddleSquare: (lambda g: g.random(),         lambda g: g.state),
+    MT19937:      (lambda g: g.extract_number(), lambda g: g.getstate()),
+    BlumBlumShub: (lambda g: g._next_bit(),      lambda g: g.state),  # un cuadrado por paso
+}
+
+
+def _step_key(gen) -> Tuple[Callable, Callable]:
+    for cls in type(gen).__mro__:
+        if cls in _STEP_KEY:
+            return _STEP_KEY[cls]
+    return (lambda g: g.random(), lambda g: g.getstate())
+
+
+# ---------------- Detección de ciclos ----------------
+def brent(gen, max_steps: int = 10**6) -> Dict[str, Any]:
+    """
+    Brent sobre una copia de gen (gen no se modifica). Memoria constante.
+    Retorna {"tail": μ, "cycle": λ, "exact": True, "steps": pasos} o, si se agota
+    max_steps, {"exact": False, "lower_bound": cota de μ+λ, ...}.
+    """
+    step, key = _step_key(gen)
+    start = gen.getstate()
+    hare = copy.deepcopy(gen)
+
+    power = lam = 1
+    tortoise = key(hare)
+    step(hare)
+    steps = 1
+    while key(hare) != tortoise:
+        if steps >= max_steps:
+            # Ronda completa de potencia P sin coincidencia (tortuga en P−1, liebre en
+            # P..2P−1): μ ≥ P o λ > P  →  μ+λ ≥ P+1
+            done = power if lam == power else power // 2
+            return {"tail": None, "cycle": None, "exact": False,
+                    "lower_bound": done + 1, "steps": steps}
+        if power == lam:
+            tortoise = key(hare)
+            power *= 2
+            lam = 0
+        step(hare)
+        lam += 1
+        steps += 1
+
+    # cola μ: tortuga desde el inicio, liebre λ pasos por delante
+    tort, hare = copy.deepcopy(gen), copy.deepcopy(gen)
+    tort.setstate(start)
+    hare.setstate(start)
+    for _ in range(lam):
+        step(hare)
+    mu = 0
+    while key(tort) != key(hare):
+        step(tort)
+        step(hare)
+        mu += 1
+    return {"tail": mu, "cycle": lam, "exact": True, "steps": steps + lam + 2 * mu}
+
+
+def hashed(gen, max_steps: int = 10**6) -> Dict[str, Any]:
+    """Detección con tabla estado→paso (memoria O(μ+λ)); mismo formato que brent()."""
+    step, key = _step_key(gen)
+    g = copy.deepcopy(gen)
+    seen = {key(g): 0}
+    for i in range(1, max_steps + 1):
+        step(g)
+        k = key(g)
+        if k in seen:
+            return {"tail": seen[k], "cycle": i - seen[k], "exact": True, "steps": i}
+        seen[k] = i
+    return {"tail": None, "cycle": None, "exact": False,
+            "lower_bound": max_steps + 1, "steps": max_steps}
+
+
+# ---------------- Condiciones analíticas (LCG / RANDU) ----------------
+def _prime_factors(n: int) -> List[int]:
+    # factorización por división de prueba (m ≤ ~2^40 en la práctica)
+    fs, d = [], 2
+    while d * d <= n:
+        if n % d == 0:
+            fs.append(d)
+            while n % d == 0:
+                n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        fs.append(n)
+    return fs
+
+
+def carmichael(m: int) -> int:
+    """λ(m): exponente del grupo (Z/mZ)*."""
+    lam, n = 1, m
+    for p in _prime_factors(m):
+        e = 0
+        while n % p == 0:
+            n //= p
+            e += 1
+        if p == 2 and e >= 3:
+            l = 2 ** (e - 2)
+        else:
+            l = (p - 1) * p ** (e - 1)
+        lam = lam * l // math.gcd(lam, l)
+    return lam
+
+
+def multiplicative_order(a: int, m: int) -> int:
+    """Orden de a en (Z/mZ)* (requiere gcd(a, m) = 1)."""
+    if math.gcd(a, m) != 1:
+        raise ValueError("a debe ser coprimo con m.")
+    order = carmichael(m)
+    for p in _prime_factors(order):
+        while order % p == 0 and pow(a, order // p, m) == 1:
+            order //= p
+    return order
+
+
+def lcg_conditions(a: int, c: int, m: int, seed: int = 1) -> Dict[str, Any]:
+    """
+    Verificación analítica del periodo de X_{k+1} = (a X_k + c) mod m.
+    c ≠ 0: Hull–Dobell ⇒ periodo m.
+    c = 0: periodo = orden de a módulo m/gcd(seed, m); máximo posible λ(m).
+    """
+    a, c, m = int(a) % int(m), int(c) % int(m), int(m)
+    if c != 0:
+        primes = _prime_factors(m)
+        conds = {
+            "gcd_c_m_1":          math.gcd(c, m) == 1,
+            "primes_divide_a_1":  all((a - 1) % p == 0 for p in primes),
+            "four_divides_a_1":   (m % 4 != 0) or ((a - 1) % 4 == 0),
+        }
+        full = all(conds.values())
+        return {"kind": "mixed", "hull_dobell": full, **conds,
+                "period": m if full else None, "max_period": m}
+
+    # multiplicativo: X_k = a^k X_0; el periodo es el orden de a módulo m/gcd(X_0, m)
+    x0 = int(seed) % m
+    if x0 == 0:
+        return {"kind": "multiplicative", "period": 1, "max_period": carmichael(m),
+                "maximal": False}
+    mod = m // math.gcd(x0, m)
+    lam = carmichael(m)
+    if math.gcd(a, mod) != 1:       # a no invertible: hay cola; sin fórmula cerrada aquí
+        return {"kind": "multiplicative", "period": None, "max_period": lam,
+                "maximal": False}
+    period = multiplicative_order(a, mod) if mod > 1 else 1
+    return {"kind": "multiplicative", "period": period, "max_period": lam,
+            "maximal": period == lam}
+
+
+# ---------------- Interfaz ----------------
+def analyze(gen, max_steps: int = 10**6, method: str = "brent") -> Dict[str, Any]:
+    """
+    Análisis de periodo de gen: detección empírica (method="brent" | "hash") y,
+    para LCG/RANDU, verificación analítica en "analytic".
+    """
+    if method not in ("brent", "hash"):
+        raise ValueError("method debe ser 'brent' o 'hash'.")
+    out = (brent if method == "brent" else hashed)(gen, max_steps)
+    out["method"] = method
+    if isinstance(gen, (LCG, RANDU)):
+        c = gen.c if isinstance(gen, LCG) else 0
+        out["analytic"] = lcg_conditions(gen.a, c, gen.m, seed=gen.state)
+    return out
@@ -1,4 +1,13 @@
-class RANDU:
+import copy
+from typing import List
+
+import numpy as np
+
+from .base import BasePRNG
+from .lcg import affine_pow, leapfrog_fill, spawn_stride
+
+
+class RANDU(BasePRNG):
     # RANDU — LCG histórico de mala calidad (uso educativo).
     # Recurrencia: X_{k+1} = (a * X_k) mod m ; c=0
     # Parámetros: a = 65539 (= 2^16 + 3), m = 2^31
@@ -7,6 +16,8 @@ class RANDU:
 
     a = 65539          # multiplicador
     m = 2**31          # módulo (2147483648)
+    period = 2**29     # periodo con semilla impar (a ≡ 3 mod 8, m = 2^31)
+    word_range = 2**28 # palabras crudas equiprobables (ver random_words)
 
     def __init__(self, seed: int = 1):
         # Semilla normalizada a [0, m-1] y forzada a impar para evitar perder periodo.
@@ -18,6 +29,43 @@ class RANDU:
         self.state = (self.a * self.state) % self.m
         return self.state / self.m
 
-    def randint(self, low: int, high: int) -> int:
-        # Entero en [low, high] vía escala de random(); posible sesgo por discretización.
-        return low + int(self.random() * (high - low + 1))
+    def _fill(self, out) -> None:
+        # Bloques vectorizados (leapfrog, c=0); misma secuencia que random()
+        self.state = leapfrog_fill(out, self.state, self.a, 0, self.m)
+
+    def jump(self, k: int) -> None:
+        # Avanza el estado k pasos en O(log k): X_{n+k} = a^k · X_n mod m
+        A, _ = affine_pow(self.a, 0, self.m, k)
+        self.state = (A * self.state) % self.m
+
+    def spawn(self, n_streams: int, stride: int = None) -> List["RANDU"]:
+        # n_streams subflujos disjuntos a distancia stride (por defecto
+        # spawn_stride(period, n_streams): ≈ period / n_streams, impar) desde el estado
+        # actual. El generador original no se modifica.
+        n_streams = int(n_streams)
+        if n_streams < 1:
+            raise ValueError("n_streams debe ser ≥ 1.")
+        stride = spawn_stride(self.period, n_streams) if stride is None else int(stride)
+        streams = []
+        for i in range(n_streams):
+            g = copy.copy(self)
+            g.jump(i * stride)
+            streams.append(g)
+        return streams
+
+    def getstate(self) -> int:
+        # Instantánea del estado interno (restaurable con setstate)
+        return self.state
+
+    def setstate(self, state: int) -> None:
+        self.state = int(state)
+
+    def random_word(self) -> int:
+        # escalar de random_words: avanza el estado y descarta los 3 bits bajos
+        self.state = (self.a * self.state) % self.m
+        return self.state >> 3
+
+    def random_words(self, n: int) -> np.ndarray:
+        # Los estados (impares) recorren {s0, 3·s0} mod 8 × 2^28: X >> 3 es equiprobable
+        # en [0, 2^28) a lo largo del periodo; los 3 bits bajos no aportan azar.
+        return np.rint(self.random_array(n) * self.m).astype(np.uint64) >> np.uint64(3)
@@ -0,0 +1,194 @@
+# prngs/spectral.py
+# Prueba espectral analítica (Knuth, TAOCP vol. 2 §3.3.4) para generadores congruenciales.
+#   ν_t = longitud del vector no nulo más corto s ∈ Z^t con
+#         s_1 + a·s_2 + … + a^{t−1}·s_t ≡ 0 (mod m)   (retículo dual de los t-uplos)
+#   1/ν_t es la distancia máxima entre hiperplanos paralelos que cubren los puntos.
+#   Cálculo: reducción LLL de la base del retículo dual y enumeración Fincke–Pohst
+#   (orden Schnorr–Euchner) sobre la base reducida; normas exactas en enteros.
+#   Incremental: la base reducida de t−1 dimensiones, extendida con un 0 y la fila
+#   (−a^{t−1} mod m, 0, …, 1), genera el retículo de t dimensiones; LLL parte de ahí.
+#   Figuras de mérito normalizadas: S_t = ν_t / (γ_t^{1/2} m^{1/t}) ∈ (0, 1] (γ_t: constante
+#   de Hermite) y μ_t = π^{t/2} ν_t^t / (Γ(t/2+1) m) de Knuth.
+
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .lcg import LCG
+from .randu import RANDU
+
+# γ_t^t (constantes de Hermite conocidas, t = 2..8)
+_HERMITE_POW = {2: 4 / 3, 3: 2.0, 4: 4.0, 5: 8.0, 6: 64 / 3, 7: 64.0, 8: 256.0}
+DIMS = tuple(range(2, 9))
+
+
+# ---------------- Retículo ----------------
+def dual_basis(a: int, m: int, t: int) -> List[List[int]]:
+    """Base del retículo {s : s_1 + a s_2 + … + a^{t−1} s_t ≡ 0 (mod m)} (filas)."""
+    B = [[m] + [0] * (t - 1)]
+    p = 1
+    for j in range(1, t):
+        p = (p * a) % m
+        row = [0] * t
+        row[0], row[j] = -p, 1
+        B.append(row)
+    return B
+
+
+def _gram_schmidt_row(B, Bs, bb, mu, k: int) -> None:
+    # recalcula b*_k, |b*_k|² y μ_{k,j} (j < k)
+    b = [float(x) for x in B[k]]
+    v = b[:]
+    mk = mu[k]
+    for j in range(k):
+        bs = Bs[j]
+        m_kj = sum(map(float.__mul__, b, bs)) / bb[j]
+        mk[j] = m_kj
+        v = [vi - m_kj * bj for vi, bj in zip(v, bs)]
+    Bs[k] = v
+    bb[k] = sum(map(float.__mul__, v, v))
+
+
+def lll(B: Sequence[Sequence[int]], delta: float = 0.99) -> Tuple[List[List[int]], List[List[float]], List[float]]:
+    """
+    Reducción LLL (base entera, Gram–Schmidt en punto flotante). Retorna
+    (base reducida, μ, |b*_i|²) para la enumeración.
+    """
+    B = [list(map(int, b)) for b in B]
+    n = len(B)
+    Bs: List[List[float]] = [[] for _ in range(n)]
+    bb = [0.0] * n
+    mu = [[0.0] * n for _ in range(n)]
+    _gram_schmidt_row(B, Bs, bb, mu, 0)
+    k = 1
+    while k < n:
+        _gram_schmidt_row(B, Bs, bb, mu, k)
+        for j in range(k - 1, -1, -1):          # reducción de tamaño
+            q = round(mu[k][j])
+            if q:
+                B[k] = [x - q * y for x, y in zip(B[k], B[j])]
+                for i in range(j):
+                    mu[k][i] -= q * mu[j][i]
+                mu[k][j] -= q
+        if bb[k] >= (delta - mu[k][k - 1] ** 2) * bb[k - 1]:
+            k += 1
+        else:                                   # condición de Lovász: intercambio
+            B[k], B[k - 1] = B[k - 1], B[k]
+            if k == 1:                          # la fila 0 no se revisita en el bucle
+                _gram_schmidt_row(B, Bs, bb, mu, 0)
+            k = max(k - 1, 1)
+    # al salir, cada fila fue recalculada en su última visita: μ y |b*|² vigentes
+    return B, mu, bb
+
+
+def shortest_vector(B: Sequence[Sequence[int]], reduced=None) -> Tuple[int, List[int]]:
+    """
+    Vector no nulo más corto del retículo generado por B: LLL + enumeración
+    Fincke–Pohst (Schnorr–Euchner). Retorna (norma² exacta, vector).
+    reduced: salida de lll(B) ya calculada.
+    """
+    B, mu, bb = reduced if reduced is not None else lll(B)
+    n = len(B)
+    best_v = min(B, key=lambda v: sum(x * x for x in v))
+    best = sum(x * x for x in best_v)
+    x = [0] * n
+
+    def rec(i: int, partial: float) -> None:
+        nonlocal best, best_v
+        c = -sum(x[j] * mu[j][i] for j in range(i + 1, n))
+        r2 = (best - partial) / bb[i]
+        if r2 < 0:
+            return
+        r = math.sqrt(r2) * (1 + 1e-9) + 1e-9   # holgura: la comprobación final es exacta
+        for xi in range(math.ceil(c - r), math.floor(c + r) + 1):
+            p = partial + (xi - c) ** 2 * bb[i]
+            if p > best * (1 + 1e-9):
+                continue
+            x[i] = xi
+            if i:
+                rec(i - 1, p)
+            elif any(x):
+                v = [sum(x[j] * B[j][col] for j in range(n)) for col in range(n)]
+                nv = sum(e * e for e in v)
+                if nv < best:
+                    best, best_v = nv, v
+        x[i] = 0
+
+    rec(n - 1, 0.0)
+    return best, best_v
+
+
+# ---------------- Prueba espectral ----------------
+def spectral(a: int, m: int, dims: Iterable[int] = DIMS, stop_below: float = 0.0) -> Dict[str, Any]:
+    """
+    Prueba espectral de x_{k+1} = a·x_k + c (mod m) (c no influye en el retículo).
+    Por dimensión t: ν_t² (exacto), ν_t, vector más corto, S_t y μ_t. "min_S" resume
+    la peor dimensión (criterio usual para comparar multiplicadores).
+    stop_below: corta en la primera dimensión con S_t < stop_below ("stopped": True).
+    """
+    a, m = int(a) % int(m), int(m)
+    dims = sorted(set(dims))
+    if any(t not in _HERMITE_POW for t in dims):
+        raise ValueError("dimensiones soportadas: 2..8.")
+    out: Dict[str, Any] = {"a": a, "m": m, "dims": {}}
+    B = [[m]]                                   # retículo de dimensión 1 (reducido)
+    p = 1
+    for t in range(2, max(dims, default=1) + 1):
+        p = (p * a) % m
+        B = [row + [0] for row in B] + [[-p] + [0] * (t - 2) + [1]]
+        red = lll(B)
+        B = red[0]
+        if t not in dims:
+            continue
+        nu2, v = shortest_vector(B, red)
+        nu = math.sqrt(nu2)
+        S = nu / (_HERMITE_POW[t] ** (1 / (2 * t)) * m ** (1 / t))
+        mu_t = math.pi ** (t / 2) * nu ** t / (math.gamma(t / 2 + 1) * m)
+        out["dims"][t] = {"nu2": nu2, "nu": nu, "vector": v, "S": S, "mu": mu_t,
+                          "hyperplane_gap": 1 / nu}
+        if S < stop_below:
+            out["stopped"] = True
+            break
+    out["min_S"] = min(d["S"] for d in out["dims"].values()) if out["dims"] else float("nan")
+    return out
+
+
+def lattice_modulus(a: int, c: int, m: int) -> int:
+    """
+    Módulo efectivo del retículo: m, salvo multiplicativo con m = 2^e y a ≡ 3, 5 (mod 8),
+    donde los estados (semilla impar) recorren una clase de periodo m/4 (Knuth: usar m/4).
+    """
+    if c == 0 and m & (m - 1) == 0 and a % 8 in (3, 5):
+        return m // 4
+    return m
+
+
+def analyze_lattice(gen, dims: Iterable[int] = DIMS) -> Dict[str, Any]:
+    """Prueba espectral de un LCG o RANDU a partir de sus parámetros (sin generar valores)."""
+    if not isinstance(gen, (LCG, RANDU)):
+        raise TypeError("la prueba espectral analítica aplica a LCG y RANDU.")
+    c = gen.c if isinstance(gen, LCG) else 0
+    return spectral(gen.a, lattice_modulus(gen.a, c, gen.m), dims)
+
+
+def screen(multipliers: Iterable[int], m: int, dims: Iterable[int] = DIMS,
+           top: int = 10, min_S: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    Evalúa muchos multiplicadores candidatos y retorna los 'top' con mayor min_S (y
+    min_S ≥ min_S). Poda: un candidato se descarta en cuanto una dimensión queda por
+    debajo del peor de los 'top' actuales, sin calcular las restantes.
+    """
+    dims = tuple(dims)
+    best: List[Tuple[float, int, Dict[str, float]]] = []   # heap mínimo por min_S
+    for i, a in enumerate(multipliers):
+        bound = max(min_S, best[0][0]) if len(best) >= top else min_S
+        r = spectral(a, m, dims, stop_below=bound)
+        if r.get("stopped") or r["min_S"] < bound:
+            continue
+        item = (r["min_S"], i, {"a": r["a"], "min_S": r["min_S"],
+                                "S": {t: d["S"] for t, d in r["dims"].items()}})
+        if len(best) < top:
+            heapq.heappush(best, item)
+        else:
+            heapq.heapreplace(best, item)
+    return [row for _, _, row in sorted(best, key=lambda it: (-it[0], it[1]))]
@@ -0,0 +1,75 @@
+# BENCHMARKS — throughput de los PRNGs (escalar, lote, paralelo, randint, sembrado, twist MT)
+# Salida: out/bench.json ; --baseline B compara contra B y falla (exit 1) si algún
+# throughput cae más de --threshold ; --save-baseline guarda la corrida como línea base.
+# --import-budget MS: falla si importar un generador ("import prngs.lcg", incluye numpy;
+# intérprete nuevo, mediana) supera MS ms.
+
+import os, json, sys, platform, argparse
+from concurrent.futures import ProcessPoolExecutor
+from tests.bench import BUDGET_MODULE, GENERATORS, IMPORT_MODULES, bench_generator, compare, import_time
+
+OUT = os.path.join(os.path.dirname(__file__), '..', 'out')
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmarks de PRNGs")
+    ap.add_argument("--only", nargs="*", choices=sorted(GENERATORS), help="subconjunto de generadores")
+    ap.add_argument("--n", type=int, default=100_000, help="valores por medición")
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--warmup", type=int, default=1)
+    ap.add_argument("--workers", type=int, default=0, help="procesos del modo paralelo (0 = sin modo paralelo)")
+    ap.add_argument("--out", default=os.path.join(OUT, "bench.json"))
+    ap.add_argument("--baseline", default=None, help="JSON de línea base para detectar regresiones")
+    ap.add_argument("--threshold", type=float, default=0.10, help="caída relativa tolerada (0.10 = 10%%)")
+    ap.add_argument("--save-baseline", action="store_true", help="escribe esta corrida en --baseline")
+    ap.add_argument("--import-budget", type=float, default=None, metavar="MS",
+                    help=f"presupuesto de 'import {BUDGET_MODULE}' en ms (falla si se supera)")
+    args = ap.parse_args(argv)
+
+    names = args.only or list(GENERATORS)
+    ex = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        results = {}
+        for name in names:
+            results[name] = bench_generator(name, n=args.n, repeats=args.repeats, warmup=args.warmup,
+                                            executor=ex, workers=args.workers)
+            modes = ", ".join(f"{m} {r['per_s']:.3g}/s" for m, r in results[name].items())
+            print(f"- {name}: {modes}")
+    finally:
+        if ex is not None:
+            ex.shutdown()
+
+    imports = {m: import_time(m, repeats=args.repeats) for m in IMPORT_MODULES}
+    for m, r in imports.items():
+        print(f"- import {m}: {r['median_us'] / 1000:.1f} ms")
+
+    report = {"python": sys.version.split()[0], "platform": platform.platform(),
+              "n": args.n, "repeats": args.repeats, "warmup": args.warmup, "results": results,
+              "imports": imports}
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"[OK] Benchmarks → {args.out}")
+
+    if args.import_budget is not None:
+        ms = imports[BUDGET_MODULE]["median_us"] / 1000
+        if ms > args.import_budget:
+            print(f"[PRESUPUESTO] import {BUDGET_MODULE}: {ms:.1f} ms > {args.import_budget:.1f} ms")
+            sys.exit(1)
+        print(f"[OK] import {BUDGET_MODULE}: {ms:.1f} ms ≤ {args.import_budget:.1f} ms")
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"[OK] Línea base guardada → {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regs = compare(report, json.load(f), args.threshold)
+        for r in regs:
+            print(f"[REGRESIÓN] {r['generator']}/{r['mode']}: {r['per_s']:.3g}/s "
+                  f"vs {r['baseline_per_s']:.3g}/s (×{r['ratio']:.2f})")
+        if regs:
+            sys.exit(1)
+        print(f"[OK] Sin regresiones > {args.threshold:.0%} frente a {args.baseline}")
+
+if __name__ == "__main__":
+    main()
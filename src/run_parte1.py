@@ -1,22 +1,54 @@
 # PARTE 1 — PRNGs: histogramas, pruebas de hipótesis y tabla visual
 # N=1000, BINS=35. Pruebas (b): χ² (uniformidad), rachas Z (independencia), ρ̂1 (lag-1).
+# Batería extendida: serial solapada 2D/3D, póker, gap, birthday spacings y KS; todas
+# las decisiones por p-valor (calculado en tests.utils) contra P_MIN_95.
 # Comparación (c): algoritmo elegido vs random (stdlib) y secrets (OS) en una tabla.
 # Salida: out/hist_*.png, out/parte1_summary.json, out/parte1_tabla.png, out/parte1_comp_<algo>.png
+# --adaptive-alpha A: N secuencial (lotes crecientes desde N) hasta que el χ² acumulado
+# rechace la uniformidad a nivel A (Bonferroni sobre las miradas) o se alcance --max-n:
+# n reportado = muestras necesarias para detectar el fallo (max-n si no se detecta).
+# --cache: las muestras de los generadores de prngs se leen de out/cache/streams (memmap).
+# Incremental: cada resultado lleva una clave de contenido (configuración del generador,
+# N, BINS, parámetros de las pruebas y versión del código); si coincide con la de
+# out/parte1_summary.json y su histograma existe, se reutiliza. Los veredictos (pass_*)
+# se recalculan siempre desde los estadísticos, así que cambiar un umbral solo vuelve a
+# dibujar las tablas. --only NOMBRE... fuerza el recálculo; --workers W reparte run_one
+# en W procesos.
+# --no-plots: solo out/parte1_summary.json; matplotlib no se importa (en las rutas que
+# dibujan se importa al usarse, con backend Agg).
+# --trace: traza JSON lines en out/parte1_trace.jsonl (tests.trace): tiempo por etapa
+# (period, sample, save_hist, evaluate, tables), extracciones por PRNG y RSS máximo;
+# --trace-memory añade el pico de memoria por etapa (tracemalloc, más lento).
 
-import os, json, math, random, secrets
-import matplotlib.pyplot as plt
+import os, json, math, random, argparse, hashlib, inspect, glob
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List
-from prngs import LCG, MiddleSquare, MT19937, BlumBlumShub, RANDU
-from tests.utils import sample, chi_square_uniform, runs_test_independence, autocorr_lag1
-from tests.plotting import save_hist
+import numpy as np
+from prngs import BasePRNG, LCG, MiddleSquare, MT19937, BlumBlumShub, RANDU
+from prngs.adapters import SecretsRNG   # secrets (SO) como random.Random
+from prngs.cache import StreamCache, CachedStream
+from prngs.period import analyze
+from prngs.spectral import analyze_lattice
+from montecarlo.sequential import RejectionRule
+from tests.utils import (sample, sample_until, StreamAccumulator, autocorr, ljung_box, spectral_test,
+                         chi2_sf, serial_test, poker_test, gap_test, birthday_spacings, ks_test)
+from tests.plotting import pyplot, save_hist
+from tests.trace import Tracer
 
 # ---------------- Configuración ----------------
 OUT = os.path.join(os.path.dirname(__file__), '..', 'out')
 N, BINS         = 1000, 35                    # tamaño de muestra y bins (χ²: df=34)
-CHI2_CRIT_95    = 49.80                       # umbral 95% para df=34
 Z_CRIT_95       = 1.96                        # |Z| crítico ~ N(0,1)
 AC1_MAX         = lambda n: 2.0/math.sqrt(n)  # regla |ρ̂1| ≤ 2/√N
 COMPARE_ALGO    = "LCG"                       # algoritmo elegido para (c)
+MAX_LAG         = 32                          # retardos de ρ̂_k (FFT) y Ljung–Box (df=MAX_LAG)
+SPECTRAL_BITS   = 8                           # bits por muestra para la prueba espectral DFT
+P_MIN_95        = 0.05                        # nivel de las pruebas con p-valor
+PERIOD_BUDGET   = 100_000                     # pasos máx. de detección de ciclos (Brent)
+SERIAL_K        = {2: 8, 3: 4}                # celdas por eje de la serial solapada (64 celdas)
+POKER_K, HAND   = 10, 5                       # categorías y tamaño de mano del póker
+GAP_RANGE       = (0.0, 0.5)                  # intervalo [lo, hi) de la prueba gap
+BDAY_M, BDAY_BITS = 256, 24                   # cumpleaños por réplica y log2(días)
 
 # Período teórico (con orden de magnitud cuando aplica)
 PERIOD_NOTE = {
@@ -29,40 +61,90 @@ PERIOD_NOTE = {
     "secrets":      "CSPRNG (sin período determinista)",
 }
 
-# ------------- RNG extra (secrets) -------------
-def _secrets_float():            # fracción de 52 bits ~ Unif[0,1)
-    return secrets.randbits(52) / (1 << 52)
-class SecretsRNG:                # adaptador .random()
-    def random(self): return _secrets_float()
-
 # ----------------- Pruebas (b) -----------------
-def evaluate(xs: List[float], bins: int) -> Dict[str, Any]:
+def statistics(xs: List[float], bins: int) -> Dict[str, Any]:
+    # estadísticos (cacheables: no dependen de los umbrales)
+    # una sola pasada: conteos χ², rachas y sumas para ρ̂1
+    acc = StreamAccumulator(bins).update(xs)
+
     # χ²: uniformidad 1D contra Unif[0,1)
-    chi2, df = chi_square_uniform(xs, bins=bins)
+    chi2, df = acc.chi_square()
 
     # Rachas: independencia básica alrededor de 0.5 (Wald–Wolfowitz)
-    runs = runs_test_independence(xs)
+    runs = acc.runs()
     Z = runs.get("Z", float("nan"))
-    p_runs = math.erfc(abs(Z)/math.sqrt(2)) if math.isfinite(Z) else float("nan")  # p≈2(1-Φ(|Z|))
 
     # ρ̂1: autocorrelación lag-1
-    ac1 = autocorr_lag1(xs)
+    ac1 = acc.autocorr_lag1()
+
+    # ρ̂_k, k=1..MAX_LAG (FFT) + Ljung–Box; prueba espectral DFT sobre los bits
+    rho = autocorr(xs, MAX_LAG)
+    Q, h, p_lb = ljung_box(rho, len(xs))
+    kmax = int(abs(rho[1:]).argmax()) + 1
+    spec = spectral_test(xs, bits=SPECTRAL_BITS)
+
+    # batería extendida (kernels vectorizados sobre el mismo array)
+    x = np.asarray(xs, dtype=np.float64)
+    ser = {d: serial_test(x, d, k) for d, k in SERIAL_K.items()}
+    pk = poker_test(x, hand=HAND, k=POKER_K)
+    gap = gap_test(x, *GAP_RANGE)
+    bd = birthday_spacings(x, m=BDAY_M, days_bits=BDAY_BITS)
+    ks = ks_test(x)
+
+    return {
+        "n": len(xs), "chi2": chi2, "df": df, "chi2_p": chi2_sf(chi2, df),
+        "runs_R": runs.get("R"), "runs_Z": Z,
+        "autocorr_lag1": ac1,
+        "autocorr_lags": rho[1:].tolist(), "autocorr_max_abs": float(abs(rho[kmax])),
+        "autocorr_max_lag": kmax,
+        "ljung_box_Q": Q, "ljung_box_df": h, "ljung_box_p": p_lb,
+        "spectral_d": spec["d"], "spectral_p": spec["p"],
+        **{f"serial{d}_{k}": r[k] for d, r in ser.items() for k in ("stat", "df", "p")},
+        "poker_chi2": pk["chi2"], "poker_df": pk["df"], "poker_p": pk["p"],
+        "gap_chi2": gap["chi2"], "gap_df": gap["df"], "gap_p": gap["p"],
+        "birthday_J": bd["J"], "birthday_lambda": bd["lambda"], "birthday_p": bd["p"],
+        "ks_D": ks["D"], "ks_p": ks["p"],
+    }
 
+# columnas de p-valor de la batería extendida: (encabezado, clave p, clave de decisión)
+P_COLS = [
+    ("Serial 2D",  "serial2_p",  "pass_serial2_95"),
+    ("Serial 3D",  "serial3_p",  "pass_serial3_95"),
+    ("Póker",      "poker_p",    "pass_poker_95"),
+    ("Gap",        "gap_p",      "pass_gap_95"),
+    ("Cumpleaños", "birthday_p", "pass_birthday_95"),
+    ("KS",         "ks_p",       "pass_ks_95"),
+]
+
+def verdicts(st: Dict[str, Any]) -> Dict[str, Any]:
+    # decisiones a partir de los estadísticos y los umbrales actuales (baratas: no se cachean)
+    Z = st["runs_Z"]
+    p_runs = math.erfc(abs(Z)/math.sqrt(2)) if math.isfinite(Z) else float("nan")  # p≈2(1-Φ(|Z|))
     return {
-        "chi2": chi2, "df": df, "pass_chi2_95": (chi2 < CHI2_CRIT_95),
-        "runs_R": runs.get("R"), "runs_Z": Z, "runs_p": p_runs, "pass_runs_95": (abs(Z) <= Z_CRIT_95),
-        "autocorr_lag1": ac1, "pass_ac1_rule": (abs(ac1) <= AC1_MAX(len(xs))),
+        "pass_chi2_95": (st["chi2_p"] >= P_MIN_95),
+        "runs_p": p_runs, "pass_runs_95": (abs(Z) <= Z_CRIT_95),
+        "pass_ac1_rule": (abs(st["autocorr_lag1"]) <= AC1_MAX(st["n"])),
+        "pass_ljung_box_95": (st["ljung_box_p"] >= P_MIN_95),
+        "pass_spectral_95": (st["spectral_p"] >= P_MIN_95),
+        **{pas: (st[key] >= P_MIN_95) for _, key, pas in P_COLS},
     }
 
+def evaluate(xs: List[float], bins: int) -> Dict[str, Any]:
+    # estadísticos + decisiones
+    st = statistics(xs, bins)
+    return {**st, **verdicts(st)}
+
 # -------------- Tabla visual (PNG) --------------
+def _fmt_p(p) -> str:
+    return "<0.001" if (isinstance(p, float) and p < 1e-3) else f"{p:.3f}"
+
 def _row(r: Dict[str, Any]) -> List[str]:
-    p = r["runs_p"]
-    pstr = "<0.001" if (isinstance(p, float) and p < 1e-3) else f"{p:.3f}"
     return [
         r["name"], PERIOD_NOTE.get(r["name"], "N/D"),
         f'{r["chi2"]:.2f}', str(r["df"]), "OK" if r["pass_chi2_95"] else "FAIL",
-        f'{r["runs_Z"]:.2f}', pstr, "OK" if r["pass_runs_95"] else "FAIL",
-        f'{r["autocorr_lag1"]:.3f}', "OK" if r["pass_ac1_rule"] else "FAIL"
+        f'{r["runs_Z"]:.2f}', _fmt_p(r["runs_p"]), "OK" if r["pass_runs_95"] else "FAIL",
+        f'{r["autocorr_lag1"]:.3f}', "OK" if r["pass_ac1_rule"] else "FAIL",
+        *[_fmt_p(r[key]) for _, key, _ in P_COLS]
     ]
 
 def _colors(rows: List[Dict[str,Any]], ncols: int):
@@ -72,19 +154,23 @@ def _colors(rows: List[Dict[str,Any]], ncols: int):
         row[4] = "#c8e6c9" if r["pass_chi2_95"] else "#ffcdd2"   # χ²
         row[7] = "#c8e6c9" if r["pass_runs_95"] else "#ffcdd2"   # rachas
         row[9] = "#c8e6c9" if r["pass_ac1_rule"] else "#ffcdd2"  # ρ̂1
+        for j, (_, _, pas) in enumerate(P_COLS, start=10):       # p-valores de la batería
+            row[j] = "#c8e6c9" if r[pas] else "#ffcdd2"
         cols.append(row)
     return cols
 
 def save_table_png(results: List[Dict[str,Any]], path: str, title: str):
-    headers = ["PRNG","Período (teórico)","χ²","df","χ² 5%","Z(rachas)","p","Rachas 5%","ρ̂1","|ρ̂1|≤2/√N"]
+    headers = ["PRNG","Período (teórico)","χ²","df","χ² 5%","Z(rachas)","p","Rachas 5%","ρ̂1","|ρ̂1|≤2/√N",
+               *[f"p {h}" for h, _, _ in P_COLS]]
     body    = [_row(r) for r in results]
     colors  = _colors(results, len(headers))
 
     # anchos relativos: más espacio a PRNG/Período para leer el orden de magnitud
-    colw = [0.16, 0.36, 0.06, 0.05, 0.07, 0.10, 0.06, 0.10, 0.05, 0.07]
+    colw = [0.16, 0.36, 0.06, 0.05, 0.07, 0.10, 0.06, 0.10, 0.05, 0.07] + [0.08] * len(P_COLS)
 
+    plt = pyplot()
     fig_h = 0.55 * (len(body) + 2)
-    fig_w = 18
+    fig_w = 26
     fig, ax = plt.subplots(figsize=(fig_w, fig_h)); ax.axis('off')
 
     tab = ax.table(cellText=body, colLabels=headers, cellColours=colors,
@@ -121,6 +207,7 @@ def save_comp_png(results: List[Dict[str,Any]], algo: str, path: str):
         row[3]="#c8e6c9" if r["pass_ac1_rule"] else "#ffcdd2"
         colors.append(row)
     colw = [0.35, 0.22, 0.22, 0.21]
+    plt = pyplot()
     fig, ax = plt.subplots(figsize=(9, 0.6*(len(body)+2))); ax.axis('off')
     tab = ax.table(cellText=body, colLabels=headers, cellColours=colors,
                    colWidths=colw, cellLoc='center', colLoc='center', loc='center')
@@ -135,45 +222,208 @@ def save_comp_png(results: List[Dict[str,Any]], algo: str, path: str):
     plt.savefig(path, bbox_inches='tight', dpi=220)
     plt.close()
 
+# --------------- Caché incremental ---------------
+_SRC = os.path.dirname(os.path.abspath(__file__))
+
+def _code_version() -> str:
+    # sha1 de las fuentes de las que dependen los estadísticos y los histogramas
+    h = hashlib.sha1()
+    files = sorted(glob.glob(os.path.join(_SRC, "prngs", "*.py")))
+    files += [os.path.join(_SRC, "tests", f) for f in ("utils.py", "plotting.py")]
+    files += [os.path.join(_SRC, "montecarlo", "sequential.py")]
+    for path in files:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    for fn in (statistics, run_one):
+        h.update(inspect.getsource(fn).encode())
+    return h.hexdigest()
+
+def stat_params() -> Dict[str, Any]:
+    # todas las constantes de las que dependen los estadísticos de statistics()
+    return {"N": N, "BINS": BINS, "MAX_LAG": MAX_LAG, "SPECTRAL_BITS": SPECTRAL_BITS,
+            "PERIOD_BUDGET": PERIOD_BUDGET, "SERIAL_K": SERIAL_K, "POKER_K": POKER_K,
+            "HAND": HAND, "GAP_RANGE": GAP_RANGE, "BDAY_M": BDAY_M, "BDAY_BITS": BDAY_BITS}
+
+def cache_key(config: Any, rule: RejectionRule = None, version: str = "") -> str:
+    # clave de contenido de un resultado
+    desc = {"gen": config, "params": stat_params(),
+            "rule": vars(rule) if rule else None, "code": version}
+    return hashlib.sha1(json.dumps(desc, sort_keys=True, default=str).encode()).hexdigest()
+
+def _render_key(*parts) -> str:
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+def load_previous(path: str) -> Dict[str, Any]:
+    # resumen de la corrida anterior (vacío si no existe o está corrupto)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 # ------------------- Pipeline -------------------
-def run_one(name: str, rng) -> Dict[str, Any]:
-    # genera muestra, guarda histograma y evalúa pruebas (b)
-    xs = sample(rng, n=N)
-    save_hist(xs, os.path.join(OUT, f"hist_{name}.png"), bins=BINS,
-              title=f"Histogram of Pseudo-random Numbers ({name})")
-    base = evaluate(xs, bins=BINS)
-    return {"name": name, "n": N, "bins": BINS, **base}
-
-def main():
+def run_one(name: str, rng, rule: RejectionRule = None, source=None, plots: bool = True,
+            trace: bool = False, trace_memory: bool = False) -> Dict[str, Any]:
+    # trace: eventos del Tracer local (este proceso o un worker) en "_trace"
+    tr = Tracer(trace, memory=trace_memory)
+    # periodo medido (Brent) antes de muestrear: detecta semillas degeneradas
+    # (BBS avanza ⌈32/k⌉ cuadrados por muestra)
+    with tr.stage("period", generator=name):
+        period = analyze(rng, max_steps=PERIOD_BUDGET) if isinstance(rng, BasePRNG) else None
+    # genera muestra (N fijo o secuencial con rule), guarda histograma y evalúa pruebas (b)
+    # source: flujo alternativo con la misma secuencia (p.ej. CachedStream)
+    src = tr.wrap(rng if source is None else source, name)
+    with tr.stage("sample", generator=name):
+        xs = sample(src, n=N) if rule is None else sample_until(src, rule, bins=BINS)
+    n = len(xs)
+    steps_per_draw = -(-32 // rng.k) if isinstance(rng, BlumBlumShub) else 1
+    if period and period["exact"] and period["tail"] + period["cycle"] < n * steps_per_draw:
+        print(f"[WARN] {name}: cola μ={period['tail']}, ciclo λ={period['cycle']} "
+              f"pasos de estado (< {n * steps_per_draw} para n={n}); la muestra se repite")
+    if plots:
+        with tr.stage("save_hist", generator=name):
+            save_hist(xs, os.path.join(OUT, f"hist_{name}.png"), bins=BINS,
+                      title=f"Histogram of Pseudo-random Numbers ({name})")
+    with tr.stage("evaluate", generator=name):
+        base = statistics(xs, bins=BINS)
+    # LCG/RANDU: prueba espectral analítica del retículo (ν_t², S_t), sin muestras
+    lattice = None
+    if isinstance(rng, (LCG, RANDU)):
+        lattice = {t: {"nu2": d["nu2"], "S": d["S"]} for t, d in analyze_lattice(rng)["dims"].items()}
+    out = {"name": name, "n": len(xs), "bins": BINS, **base, "period_measured": period,
+           "spectral_lattice": lattice}
+    if trace:
+        out["_trace"] = tr.collect()
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Parte 1 — PRNGs")
+    ap.add_argument("--adaptive-alpha", type=float, default=None,
+                    help="N secuencial: parar cuando el χ² rechace uniformidad a este nivel")
+    ap.add_argument("--max-n", type=int, default=10**6, help="presupuesto de muestras (modo adaptativo)")
+    ap.add_argument("--cache", action="store_true", help="leer las muestras desde la caché de flujos")
+    ap.add_argument("--only", nargs="+", default=None, metavar="NOMBRE",
+                    help="recalcula solo estos generadores (el resto se reutiliza si su clave coincide)")
+    ap.add_argument("--workers", type=int, default=1, help="procesos para run_one (1 = secuencial)")
+    ap.add_argument("--no-plots", action="store_true", help="solo JSON: no genera PNG ni importa matplotlib")
+    ap.add_argument("--trace", action="store_true", help="escribe out/parte1_trace.jsonl (etapas, extracciones)")
+    ap.add_argument("--trace-memory", action="store_true", help="con --trace: pico de memoria por etapa (tracemalloc)")
+    args = ap.parse_args(argv)
+    rule = None
+    if args.adaptive_alpha is not None:
+        rule = RejectionRule(alpha=args.adaptive_alpha, max_n=args.max_n, n0=min(N, args.max_n))
+
     os.makedirs(OUT, exist_ok=True)
-    gens = [
-        ("LCG",          LCG(seed=123456789)),
-        ("MiddleSquare", MiddleSquare(seed=675248, n_digits=6)),
-        ("MT19937",      MT19937(seed=5489)),
-        ("BBS",          BlumBlumShub(seed=8731, p=383, q=503)),
-        ("RANDU",        RANDU(seed=1)),
-        ("random",       random.Random(42)),   # MT stdlib
-        ("secrets",      SecretsRNG()),
+    specs = [   # (nombre, clase, parámetros, semilla) de los generadores de prngs
+        ("LCG",          LCG,          {},                    123456789),
+        ("MiddleSquare", MiddleSquare, {"n_digits": 6},       675248),
+        ("MT19937",      MT19937,      {},                    5489),
+        ("BBS",          BlumBlumShub, {"p": 383, "q": 503},  8731),
+        ("RANDU",        RANDU,        {},                    1),
+    ]
+    cache = StreamCache() if args.cache else None
+    gens = [(name, cls(seed=seed, **params),
+             CachedStream(cache, cls, params, seed) if cache else None,
+             {"cls": cls.__name__, "params": params, "seed": seed})
+            for name, cls, params, seed in specs]
+    gens += [   # (nombre, generador, fuente, configuración para la clave)
+        ("random",       random.Random(42), None, {"cls": "random.Random", "seed": 42}),   # MT stdlib
+        ("secrets",      SecretsRNG(),      None, {"cls": "secrets"}),  # muestra OS: se reutiliza hasta --only
     ]
-    results = [run_one(name, rng) for name, rng in gens]
+    names = [g[0] for g in gens]
+    if args.only:
+        unknown = sorted(set(args.only) - set(names))
+        if unknown:
+            ap.error(f"generadores desconocidos: {unknown}; válidos: {names}")
+
+    # reutiliza resultados con la misma clave (y su histograma); el resto se recalcula
+    summary_path = os.path.join(OUT, "parte1_summary.json")
+    prev = load_previous(summary_path)
+    prev_by_name = {r.get("name"): r for r in prev.get("results", [])}
+    version = _code_version()
+    keys = {name: cache_key(config, rule, version) for name, _, _, config in gens}
+    stats: Dict[str, Dict[str, Any]] = {}
+    todo = []
+    for name, rng, source, _ in gens:
+        old = prev_by_name.get(name)
+        fresh = (old is not None and old.get("cache_key") == keys[name]
+                 and (args.no_plots or os.path.exists(os.path.join(OUT, f"hist_{name}.png"))))
+        if fresh and not (args.only and name in args.only):
+            stats[name] = old
+        else:
+            todo.append((name, rng, source))
+    print(f"[INFO] Parte 1: recalcula {[t[0] for t in todo]}, reutiliza {sorted(stats)}")
+    tracer = Tracer(args.trace, memory=args.trace_memory)
+    for name in sorted(stats):
+        tracer.count(name, reused=True, draws=0)
+
+    if args.workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(todo))) as ex:
+            futs = [ex.submit(run_one, name, rng, rule, source, not args.no_plots,
+                              args.trace, args.trace_memory)
+                    for name, rng, source in todo]
+            done = [fu.result() for fu in futs]
+    else:
+        done = [run_one(name, rng, rule, source, not args.no_plots, args.trace, args.trace_memory)
+                for name, rng, source in todo]
+    for r in done:
+        tracer.extend(r.pop("_trace", []))
+        r["cache_key"] = keys[r["name"]]
+        stats[r["name"]] = r
 
-    with open(os.path.join(OUT, "parte1_summary.json"), "w", encoding="utf-8") as f:
+    # veredictos con los umbrales actuales (nunca cacheados)
+    results = []
+    for name in names:
+        st = {k: v for k, v in stats[name].items()
+              if not k.startswith("pass_") and k != "runs_p"}
+        results.append({**st, **verdicts(st)})
+
+    # tablas: solo se vuelven a dibujar si cambia su contenido
+    renders = {} if args.no_plots else prev.get("renders", {})   # --no-plots: sin PNG vigentes
+    if not args.no_plots:
+        with tracer.stage("tables"):
+            table_path = os.path.join(OUT, "parte1_tabla.png")
+            title = f"Pruebas de hipótesis (χ², rachas, ρ̂1, batería extendida) — N={N if rule is None else 'adaptativo'}, BINS={BINS}"
+            rk = _render_key([_row(r) for r in results], title, version)
+            if renders.get("tabla") != rk or not os.path.exists(table_path):
+                save_table_png(results, table_path, title)
+            renders["tabla"] = rk
+            comp_path = os.path.join(OUT, f"parte1_comp_{COMPARE_ALGO}.png")
+            rk = _render_key(COMPARE_ALGO, [(r["name"], r["pass_chi2_95"], r["pass_runs_95"], r["pass_ac1_rule"])
+                                            for r in results if r["name"] in (COMPARE_ALGO, "random", "secrets")],
+                             version)
+            if renders.get(f"comp_{COMPARE_ALGO}") != rk or not os.path.exists(comp_path):
+                save_comp_png(results, COMPARE_ALGO, comp_path)
+            renders[f"comp_{COMPARE_ALGO}"] = rk
+
+    with open(summary_path, "w", encoding="utf-8") as f:
         json.dump({
             "results": results,
             "thresholds": {
-                "chi2_crit_95_df34": CHI2_CRIT_95,
+                "chi2": f"p>={P_MIN_95} con df={BINS - 1}",
                 "runs_Z_crit_95": Z_CRIT_95,
-                "ac1_rule": f"|rho1|<=2/sqrt(N) con N={N}"
-            }
+                "ac1_rule": "|rho1|<=2/sqrt(N) con N=" + (str(N) if rule is None else "n de cada PRNG"),
+                "ljung_box": f"p>={P_MIN_95} con df={MAX_LAG}",
+                "spectral_dft": f"p>={P_MIN_95} ({SPECTRAL_BITS} bits/muestra)",
+                "serial": f"p>={P_MIN_95}, celdas por eje {SERIAL_K} (∇ψ² de Good)",
+                "poker": f"p>={P_MIN_95} (manos de {HAND}, k={POKER_K})",
+                "gap": f"p>={P_MIN_95} en [{GAP_RANGE[0]}, {GAP_RANGE[1]})",
+                "birthday": f"p>={P_MIN_95} (m={BDAY_M}, 2^{BDAY_BITS} días, Poisson)",
+                "ks": f"p>={P_MIN_95} (corrección de Stephens)"
+            },
+            "adaptive": {"alpha": args.adaptive_alpha, "max_n": args.max_n, "looks": rule.looks,
+                         "rule": "chi2 p < alpha/looks"} if rule else None,
+            "renders": renders
         }, f, indent=2, ensure_ascii=False)
 
-    save_table_png(results, os.path.join(OUT, "parte1_tabla.png"),
-                   "Pruebas de hipótesis (χ², rachas, ρ̂1) — N=1000, BINS=35")
-    save_comp_png(results, COMPARE_ALGO,
-                  os.path.join(OUT, f"parte1_comp_{COMPARE_ALGO}.png"))
-
-    print("[OK] Parte 1 → out/hist_*.png, out/parte1_summary.json, "
-          "out/parte1_tabla.png, out/parte1_comp_*.png")
+    if args.trace:
+        tracer.write(os.path.join(OUT, "parte1_trace.jsonl"))
+        print("[OK] Traza → out/parte1_trace.jsonl")
+    if args.no_plots:
+        print("[OK] Parte 1 → out/parte1_summary.json (sin gráficos)")
+    else:
+        print("[OK] Parte 1 → out/hist_*.png, out/parte1_summary.json, "
+              "out/parte1_tabla.png, out/parte1_comp_*.png")
 
 if __name__ == "__main__":
     main()
@@ -1,32 +1,90 @@
 # PARTE 2 — Monte Carlo (X~Unif(a,b))
 # Estimador: Î = (b-a)*mean(f(a+(b-a)U)), U~Unif(0,1). SE = (b-a)*sqrt(s_f^2/N).
 # IC95%: Î ± 1.96*SE. Comparamos contra valores teóricos y marcamos cobertura (✓/✗).
+# Modo paralelo (--shards S --workers W): N se reparte en S shards contiguos del mismo
+# flujo (jump) o semillas distintas (secrets); resultado fijo para S, sea cual sea W.
+# Modo adaptativo (--abs-tol/--rel-tol [--max-n]): lotes crecientes hasta que la
+# semiamplitud del IC95% cumple el objetivo; se reportan muestras usadas y tiempo.
+# --estimator {antithetic,control,stratified,qmc}: reducción de varianza (montecarlo.variance),
+# con factor de reducción (vrf) y muestras efectivas/s frente a MC simple.
+# --cache: MT19937 y LCG se leen de out/cache/streams (memmap), misma secuencia.
+# --trace [--trace-memory]: traza JSON lines en out/parte2_trace.jsonl (tests.trace) con
+# tiempo (y pico de memoria) por integrando y extracciones por generador.
 
-import os, json, math, random, secrets
-from montecarlo.core import f1, f2          # f1(x)=sin(pi x), f2(x)=phi(x) (N(0,1))
+import os, json, math, random, argparse
+from concurrent.futures import ProcessPoolExecutor
+from montecarlo.core import f1_vec, f2_vec  # f1(x)=sin(pi x), f2(x)=phi(x) (N(0,1)), sobre arrays
+from montecarlo.integrate import integrate, integrate_adaptive, integrate_sharded, integrate_stream_sharded, shard_sizes
+from montecarlo.sequential import StoppingRule
+from montecarlo.variance import ESTIMATORS
 from prngs import LCG, MT19937
+from prngs.adapters import SecretsRNG  # secrets (SO) como random.Random
+from prngs.cache import StreamCache, CachedStream
+from tests.trace import NULL, Tracer
 
 OUT, N = os.path.join(os.path.dirname(__file__), '..', 'out'), 200_000
 THEORY = {"int_sin": 2.0/math.pi, "int_normal": 0.4772498680518208}
 
-_as_secrets = lambda: secrets.randbits(52)/(1<<52)
-class SecretsRNG:  # adaptador .random()
-    def random(self): return _as_secrets()
 
 def mc_integral_stats(f, a, b, rng, n=N):
-    w = (b-a); s1=s2=0.0
-    for _ in range(n):
-        fx = f(a + w*rng.random()); s1 += fx; s2 += fx*fx
-    m = s1/n; var = (s2 - n*m*m)/(n-1) if n>1 else 0.0
-    est = w*m; se = w*math.sqrt(var/n); ci = (est-1.96*se, est+1.96*se)
-    return est, se, ci
+    # bloques de uniformes + integrando vectorizado; momentos en streaming (memoria acotada)
+    return integrate(f, a, b, rng, n)
+
+def mc_integral_stats_sharded(f, a, b, rng, n=N, shards=1, executor=None, offset=0):
+    # mismo resultado (est, se, ci) combinando shards en orden. Con jump(): tramos
+    # contiguos [offset + Σ sizes[:i], ...) del flujo (cada worker salta a su tramo);
+    # secrets no tiene estado → un adaptador por shard; sin saltos (p.ej. random.Random)
+    # se usa el flujo secuencial
+    sizes = shard_sizes(n, shards)
+    if isinstance(rng, SecretsRNG):
+        return integrate_sharded(f, a, b, [SecretsRNG() for _ in sizes], sizes, executor=executor)
+    if not hasattr(rng, "jump"):
+        return mc_integral_stats(f, a, b, rng, n)
+    return integrate_stream_sharded(f, a, b, rng, sizes, executor=executor, offset=offset)
 
 _relerr = lambda x,t: abs(x-t)/abs(t)
 _in = lambda x,lo,hi: (lo <= x <= hi)
 
-def run_one(name, rng):
-    est1,se1,ci1 = mc_integral_stats(f1, 0.0, 1.0, rng)
-    est2,se2,ci2 = mc_integral_stats(f2, 0.0, 2.0, rng)
+def run_one_adaptive(name, rng, rule, tracer=NULL):
+    # N variable por integrando: se detiene al cumplir rule (o en rule.max_n)
+    with tracer.stage("integrate_adaptive", generator=name, integrand="sin"):
+        r1 = integrate_adaptive(f1_vec, 0.0, 1.0, rng, rule)
+    with tracer.stage("integrate_adaptive", generator=name, integrand="normal"):
+        r2 = integrate_adaptive(f2_vec, 0.0, 2.0, rng, rule)
+    row = _row(name, r1["est"], r1["se"], r1["ci"], r2["est"], r2["se"], r2["ci"])
+    row.update({"N": None,
+                "n_sin": r1["n"], "time_sin": r1["time_s"], "converged_sin": r1["converged"],
+                "n_normal": r2["n"], "time_normal": r2["time_s"], "converged_normal": r2["converged"]})
+    return row
+
+def run_one_estimator(name, rng, estimator, tracer=NULL):
+    # mismo N de evaluaciones por integrando con el estimador elegido
+    fn = ESTIMATORS[estimator]
+    with tracer.stage(estimator, generator=name, integrand="sin"):
+        r1 = fn(f1_vec, 0.0, 1.0, rng, N)
+    with tracer.stage(estimator, generator=name, integrand="normal"):
+        r2 = fn(f2_vec, 0.0, 2.0, rng, N)
+    row = _row(name, r1["est"], r1["se"], r1["ci"], r2["est"], r2["se"], r2["ci"])
+    for tag, r in (("sin", r1), ("normal", r2)):
+        row.update({f"n_calls_{tag}": r["n_calls"], f"time_{tag}": r["time_s"],
+                    f"vrf_{tag}": r["vrf"], f"eff_per_s_{tag}": r["eff_samples_per_s"]})
+    row["estimator"] = estimator
+    return row
+
+def run_one(name, rng, shards=1, executor=None, tracer=NULL):
+    if shards > 1:   # f1 usa los pasos [0, N) del flujo y f2 los [N, 2N), como en serie
+        with tracer.stage("mc_integral_stats", generator=name, integrand="sin", shards=shards):
+            est1,se1,ci1 = mc_integral_stats_sharded(f1_vec, 0.0, 1.0, rng, N, shards, executor, offset=0)
+        with tracer.stage("mc_integral_stats", generator=name, integrand="normal", shards=shards):
+            est2,se2,ci2 = mc_integral_stats_sharded(f2_vec, 0.0, 2.0, rng, N, shards, executor, offset=N)
+    else:
+        with tracer.stage("mc_integral_stats", generator=name, integrand="sin"):
+            est1,se1,ci1 = mc_integral_stats(f1_vec, 0.0, 1.0, rng)
+        with tracer.stage("mc_integral_stats", generator=name, integrand="normal"):
+            est2,se2,ci2 = mc_integral_stats(f2_vec, 0.0, 2.0, rng)
+    return _row(name, est1, se1, ci1, est2, se2, ci2)
+
+def _row(name, est1, se1, ci1, est2, se2, ci2):
     return {
         "rng":name,"N":N,
         "int_sin":est1,"se_sin":se1,"ci_sin":ci1,"err_sin":_relerr(est1,THEORY["int_sin"]),
@@ -34,27 +92,74 @@ def run_one(name, rng):
         "cover_sin":_in(THEORY["int_sin"],*ci1),"cover_normal":_in(THEORY["int_normal"],*ci2)
     }
 
-def main():
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Parte 2 — Monte Carlo")
+    ap.add_argument("--shards", type=int, default=1, help="nº de shards por integrando (1 = en serie)")
+    ap.add_argument("--workers", type=int, default=1, help="procesos para los shards")
+    ap.add_argument("--abs-tol", type=float, default=None, help="semiamplitud IC95%% absoluta objetivo")
+    ap.add_argument("--rel-tol", type=float, default=None, help="semiamplitud IC95%% relativa objetivo")
+    ap.add_argument("--max-n", type=int, default=10**8, help="presupuesto de muestras (modo adaptativo)")
+    ap.add_argument("--cache", action="store_true", help="leer MT19937/LCG desde la caché de flujos")
+    ap.add_argument("--estimator", choices=sorted(ESTIMATORS), default="crude",
+                    help="estimador (reducción de varianza); crude = MC simple")
+    ap.add_argument("--trace", action="store_true", help="escribe out/parte2_trace.jsonl (etapas, extracciones)")
+    ap.add_argument("--trace-memory", action="store_true", help="con --trace: pico de memoria por etapa (tracemalloc)")
+    args = ap.parse_args(argv)
+    if args.estimator != "crude" and (args.shards > 1 or args.abs_tol is not None or args.rel_tol is not None):
+        ap.error("--estimator no se combina con --shards ni con el modo adaptativo")
+    rule = None
+    if args.abs_tol is not None or args.rel_tol is not None:
+        if args.shards > 1:
+            ap.error("el modo adaptativo no se combina con --shards")
+        rule = StoppingRule(abs_tol=args.abs_tol, rel_tol=args.rel_tol, max_n=args.max_n)
+
     os.makedirs(OUT, exist_ok=True)
+    cache = StreamCache() if args.cache else None
+    _mk = lambda cls, seed: CachedStream(cache, cls, {}, seed) if cache else cls(seed=seed)
     gens = [("random(PyStd MT19937)", random.Random(12345)),
-            ("MT19937(5489)",         MT19937(seed=5489)),
-            ("LCG(123456789)",        LCG(seed=123456789)),
+            ("MT19937(5489)",         _mk(MT19937, 5489)),
+            ("LCG(123456789)",        _mk(LCG, 123456789)),
             ("secrets(OS)",           SecretsRNG())]
-    rows = [run_one(n,g) for n,g in gens]
+    tracer = Tracer(args.trace, memory=args.trace_memory)
+    if args.shards > 1:   # los shards usan copias (o procesos): extracciones según su tamaño
+        for n, _ in gens:
+            tracer.count(n, draws=2 * N, source="shard_sizes", shards=args.shards)
+    else:                 # proxies contadores (sin efecto si --trace no está activo)
+        gens = [(n, tracer.wrap(g, n)) for n, g in gens]
+    if args.estimator != "crude":
+        rows = [run_one_estimator(n, g, args.estimator, tracer) for n,g in gens]
+    elif rule is not None:
+        rows = [run_one_adaptive(n, g, rule, tracer) for n,g in gens]
+    elif args.shards > 1 and args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as ex:
+            rows = [run_one(n, g, args.shards, ex, tracer) for n,g in gens]
+    else:
+        rows = [run_one(n, g, args.shards, tracer=tracer) for n,g in gens]
 
-    print(f"[N={N}] Monte Carlo — estimación ± IC95% (err relativo, SE) y cobertura del valor teórico")
+    print(f"[N={'adaptativo' if rule else N}] Monte Carlo — estimación ± IC95% (err relativo, SE) y cobertura del valor teórico")
     for r in rows:
         c1 = "✓" if r["cover_sin"] else "✗"
         c2 = "✓" if r["cover_normal"] else "✗"
-        print(f"- {r['rng']}")
+        extra = ""
+        if rule:
+            extra = f"  (n={r['n_sin']}/{r['n_normal']}, {r['time_sin']+r['time_normal']:.2f}s)"
+        elif args.estimator != "crude":
+            extra = (f"  [{args.estimator}: vrf {r['vrf_sin']:.1f}/{r['vrf_normal']:.1f}, "
+                     f"llamadas {r['n_calls_sin']}/{r['n_calls_normal']}]")
+        print(f"- {r['rng']}" + extra)
         print(f"  ∫_0^1 sin(πx) dx  ≈ {r['int_sin']:.6f}  [{r['ci_sin'][0]:.6f}, {r['ci_sin'][1]:.6f}]"
               f"  (err {r['err_sin']:.2e}, SE {r['se_sin']:.2e})  cover {c1}")
         print(f"  ∫_0^2 φ(x) dx     ≈ {r['int_normal']:.6f}  [{r['ci_normal'][0]:.6f}, {r['ci_normal'][1]:.6f}]"
               f"  (err {r['err_normal']:.2e}, SE {r['se_normal']:.2e})  cover {c2}")
 
     with open(os.path.join(OUT,"parte2_montecarlo.json"),"w",encoding="utf-8") as f:
-        json.dump({"N":N,"theory":THEORY,"rows":rows}, f, indent=2, ensure_ascii=False)
+        json.dump({"N":N,"shards":args.shards,"estimator":args.estimator,
+                   "adaptive":({"abs_tol":args.abs_tol,"rel_tol":args.rel_tol,"max_n":args.max_n}
+                               if rule else None),"theory":THEORY,"rows":rows}, f, indent=2, ensure_ascii=False)
     print("\n[OK] Guardado en out/parte2_montecarlo.json")
+    if args.trace:
+        tracer.write(os.path.join(OUT, "parte2_trace.jsonl"))
+        print("[OK] Traza → out/parte2_trace.jsonl")
 
 if __name__ == "__main__":
     main()
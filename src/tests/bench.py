@@ -0,0 +1,132 @@
+# tests/bench.py
+# Benchmarks de los generadores: perf_counter_ns con calentamiento y repeticiones,
+# mediana/IQR y pico de memoria (tracemalloc, en una corrida aparte para no sesgar tiempos).
+# Modos: escalar (random()), lote (random_array), paralelo (spawn + procesos), randint,
+# costo de sembrado y costo del twist de MT19937. Comparación contra una línea base JSON.
+# Tiempo de importación de prngs en intérpretes nuevos (-X importtime), con presupuesto.
+
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from prngs import LCG, MiddleSquare, MT19937, BlumBlumShub, RANDU
+from prngs.adapters import SecretsRNG
+
+
+# nombre → fábrica(seed); mismas semillas que run_parte1
+GENERATORS: Dict[str, Callable[[int], Any]] = {
+    "LCG":          lambda s=123456789: LCG(seed=s),
+    "MiddleSquare": lambda s=675248: MiddleSquare(seed=s, n_digits=6),
+    "MT19937":      lambda s=5489: MT19937(seed=s),
+    "BBS":          lambda s=8731: BlumBlumShub(seed=s, p=383, q=503),
+    "RANDU":        lambda s=1: RANDU(seed=s),
+    "random":       lambda s=42: random.Random(s),
+    "secrets":      lambda s=0: SecretsRNG(),
+}
+
+
+def measure(fn: Callable[[], Any], repeats: int = 5, warmup: int = 1,
+            memory: bool = True) -> Dict[str, Any]:
+    """Tiempo de fn() (ns): mediana, IQR, mínimo; pico de memoria de una corrida extra."""
+    for _ in range(warmup):
+        fn()
+    times: List[int] = []
+    for _ in range(repeats):
+        t0 = time.perf_counter_ns()
+        fn()
+        times.append(time.perf_counter_ns() - t0)
+    q1, _, q3 = statistics.quantiles(times, n=4) if len(times) > 1 else (times[0],) * 3
+    out = {"median_ns": statistics.median(times), "iqr_ns": q3 - q1, "min_ns": min(times),
+           "repeats": repeats, "warmup": warmup}
+    if memory:
+        tracemalloc.start()
+        fn()
+        out["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return out
+
+
+def _with_rate(res: Dict[str, Any], n: int) -> Dict[str, Any]:
+    res["n"] = n
+    res["per_s"] = n / (res["median_ns"] * 1e-9) if res["median_ns"] else float("inf")
+    return res
+
+
+def _draw(rng, n: int) -> float:
+    # tarea de un worker: n valores por lote (o escalares), devuelve una suma de control
+    batch = getattr(rng, "random_array", None)
+    if batch is not None:
+        return float(batch(n).sum())
+    return sum(rng.random() for _ in range(n))
+
+
+def bench_generator(name: str, n: int = 100_000, repeats: int = 5, warmup: int = 1,
+                    executor: Optional[ProcessPoolExecutor] = None, workers: int = 1) -> Dict[str, Any]:
+    """Todas las mediciones aplicables a un generador de GENERATORS."""
+    make = GENERATORS[name]
+    g = make()
+    res: Dict[str, Any] = {}
+
+    rnd = g.random
+    res["scalar"] = _with_rate(measure(lambda: [rnd() for _ in range(n)], repeats, warmup), n)
+    ri = g.randint
+    res["randint"] = _with_rate(measure(lambda: [ri(1, 6) for _ in range(n)], repeats, warmup), n)
+    if hasattr(g, "random_array"):
+        res["batch"] = _with_rate(measure(lambda: g.random_array(n), repeats, warmup), n)
+    if executor is not None and hasattr(g, "spawn"):
+        streams = g.spawn(workers)
+        per = -(-n // workers)
+        res["parallel"] = _with_rate(
+            measure(lambda: list(executor.map(_draw, streams, [per] * workers)),
+                    repeats, warmup, memory=False), per * workers)
+        res["parallel"]["workers"] = workers
+    res["seed"] = _with_rate(measure(lambda: make(), repeats, warmup, memory=False), 1)
+    if isinstance(g, MT19937):
+        res["twist"] = _with_rate(measure(g.twist, repeats, warmup, memory=False), MT19937.n)
+    return res
+
+
+# módulos cuyo costo de importación se mide ("prngs" es perezoso: no carga numpy)
+IMPORT_MODULES = ("prngs", "prngs.lcg", "prngs.mt19937")
+# módulo del presupuesto: import real de un generador (paquete + base + numpy), lo que
+# paga un worker con 'from prngs import LCG'
+BUDGET_MODULE = "prngs.lcg"
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module: str, repeats: int = 5) -> Dict[str, Any]:
+    """Costo de 'import module' en un intérprete nuevo (µs acumulados de -X importtime)."""
+    env = dict(os.environ, PYTHONPATH=_SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    times: List[int] = []
+    for _ in range(repeats):
+        err = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             env=env, capture_output=True, text=True, check=True).stderr
+        for line in err.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                times.append(int(parts[1]))
+    return {"median_us": statistics.median(times), "min_us": min(times), "repeats": repeats}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Regresiones: (generador, modo) cuyo throughput per_s cae más de 'threshold'
+    (fracción) respecto de la línea base. Ambos con la forma {"results": {gen: {modo: {...}}}}.
+    """
+    regressions = []
+    for gen, modes in current.get("results", {}).items():
+        for mode, res in modes.items():
+            base = baseline.get("results", {}).get(gen, {}).get(mode)
+            if not base or not base.get("per_s"):
+                continue
+            ratio = res["per_s"] / base["per_s"]
+            if ratio < 1.0 - threshold:
+                regressions.append({"generator": gen, "mode": mode, "ratio": ratio,
+                                    "per_s": res["per_s"], "baseline_per_s": base["per_s"]})
+    return regressions
@@ -1,7 +1,14 @@
 import os
-import matplotlib.pyplot as plt
+
+def pyplot():
+    # import diferido de matplotlib con backend Agg (sin GUI): solo lo pagan las rutas que dibujan
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
 
 def save_hist(samples, out_path, bins=50, title=None):
+    plt = pyplot()
     plt.figure()
     plt.hist(samples, bins=bins, density=True, edgecolor='black')
     if title:
@@ -0,0 +1,189 @@
+# tests/trace.py
+# Instrumentación opcional de los pipelines (run_parte1 / run_parte2).
+#   Tracer(enabled=False): stage() devuelve un contexto nulo compartido y wrap() devuelve
+#   el mismo generador, así que desactivado no toca la ruta caliente de random().
+#   Activado:
+#     - stage(nombre, **etiquetas): tiempo (perf_counter) y, con memory=True, pico de
+#       memoria de la etapa (tracemalloc; las etapas anidadas propagan su pico a la que
+#       las contiene). tracemalloc encarece mucho las asignaciones (matplotlib ~×20): los
+#       tiempos de una traza con memoria no son representativos.
+#     - wrap(gen, nombre): proxy que cuenta llamadas, extracciones (valores pedidos) y
+#       avance del estado por instancia (BBS: cuadrados modulares vía pos; jump(k): k pasos)
+#     - count(nombre, **campos): contabilidad explícita (p.ej. shards en otros procesos)
+#     - write(path): traza JSON lines (meta, stage, draws, process)
+
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+try:                                    # pico de RSS del proceso (solo Unix)
+    import resource
+except ImportError:                     # pragma: no cover
+    resource = None
+
+_NULL_STAGE = contextlib.nullcontext()
+
+# método → nº de valores pedidos según sus argumentos
+_DRAWS = {
+    "random":        lambda a, kw: 1,
+    "random_array":  lambda a, kw: int(a[0] if a else kw["n"]),
+    "random_uint32": lambda a, kw: int(a[0] if a else kw["n"]),
+    "random_words":  lambda a, kw: int(a[0] if a else kw["n"]),
+    "randint":       lambda a, kw: 1,
+    "randints":      lambda a, kw: int(a[2] if len(a) > 2 else kw["size"]),
+    "fill":          lambda a, kw: len(a[0] if a else kw["buffer"]),
+}
+
+
+class _Counts:
+    __slots__ = ("calls", "draws", "jumped")
+
+    def __init__(self):
+        self.calls = self.draws = self.jumped = 0
+
+
+class CountingRNG:
+    """
+    Proxy de un generador que cuenta llamadas, valores pedidos y saltos. El resto de
+    atributos se reenvía sin costo extra. Las copias (deepcopy, p.ej. substream)
+    comparten los contadores dentro del proceso.
+    """
+
+    def __init__(self, gen, name: str, counts: _Counts = None):
+        self.wrapped, self.name = gen, name
+        self._counts = counts if counts is not None else _Counts()
+        self._pos0 = getattr(gen, "pos", None)      # BBS / CachedStream: posición del flujo
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):                    # evita recursión al deserializar
+            raise AttributeError(attr)
+        target = getattr(self.wrapped, attr)
+        if attr == "jump":
+            def jump(k):
+                self._counts.jumped += int(k)
+                return target(k)
+            return jump
+        draws = _DRAWS.get(attr)
+        if draws is None:
+            return target
+
+        def counted(*args, **kwargs):
+            c = self._counts
+            c.calls += 1
+            c.draws += draws(args, kwargs)
+            return target(*args, **kwargs)
+        return counted
+
+    def __deepcopy__(self, memo):
+        import copy
+        g = CountingRNG(copy.deepcopy(self.wrapped, memo), self.name, self._counts)
+        g._pos0 = self._pos0
+        return g
+
+    def counts(self) -> Dict[str, Any]:
+        c = self._counts
+        pos = getattr(self.wrapped, "pos", None)
+        advances = pos - self._pos0 if pos is not None and self._pos0 is not None else c.draws + c.jumped
+        return {"generator": self.name, "class": type(self.wrapped).__name__,
+                "calls": c.calls, "draws": c.draws, "jumped": c.jumped, "state_advances": advances}
+
+
+class _Stage:
+    __slots__ = ("tracer", "name", "tags", "t0", "peak")
+
+    def __init__(self, tracer: "Tracer", name: str, tags: Dict[str, Any]):
+        self.tracer, self.name, self.tags = tracer, name, tags
+
+    def __enter__(self):
+        tr = self.tracer
+        self.peak = 0
+        if tr.memory:
+            if tr._stack:                           # el pico hasta aquí cuenta para la etapa padre
+                parent = tr._stack[-1]
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        tr._stack.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        dt = time.perf_counter() - self.t0
+        tr = self.tracer
+        tr._stack.pop()
+        ev = {"type": "stage", "stage": self.name, **self.tags, "time_s": dt}
+        if tr.memory:
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            ev["peak_bytes"] = self.peak
+            if tr._stack:
+                parent = tr._stack[-1]
+                parent.peak = max(parent.peak, self.peak)
+        tr.events.append(ev)
+        return False
+
+
+class Tracer:
+    def __init__(self, enabled: bool = False, memory: bool = False):
+        self.enabled = bool(enabled)
+        self.memory = self.enabled and bool(memory)
+        self.events: List[Dict[str, Any]] = []
+        self._proxies: List[CountingRNG] = []
+        self._stack: List[_Stage] = []
+        self._t0 = time.time()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name: str, **tags):
+        """Contexto que mide una etapa (nulo si el tracer está desactivado)."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, tags)
+
+    def wrap(self, gen, name: str):
+        """gen tal cual (desactivado) o un CountingRNG registrado."""
+        if not self.enabled:
+            return gen
+        proxy = CountingRNG(gen, name)
+        self._proxies.append(proxy)
+        return proxy
+
+    def count(self, generator: str, **fields) -> None:
+        if self.enabled:
+            self.events.append({"type": "draws", "generator": generator, **fields})
+
+    def extend(self, events: List[Dict[str, Any]]) -> None:
+        # eventos de otro proceso (p.ej. workers de un pool)
+        if self.enabled:
+            self.events.extend(events)
+
+    def collect(self) -> List[Dict[str, Any]]:
+        """Eventos + contadores de los proxies (vacía el registro de proxies)."""
+        for p in self._proxies:
+            self.events.append({"type": "draws", **p.counts()})
+        self._proxies = []
+        return self.events
+
+    def write(self, path: str) -> None:
+        """Escribe la traza en JSON lines (meta, etapas, extracciones, proceso)."""
+        if not self.enabled:
+            return
+        events = self.collect()
+        proc = {"type": "process", "wall_s": time.time() - self._t0}
+        if self.memory:
+            proc["traced_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        if resource is not None:
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            proc["max_rss_bytes"] = rss if sys.platform == "darwin" else rss * 1024
+        meta = {"type": "meta", "python": sys.version.split()[0], "platform": platform.platform(),
+                "pid": os.getpid(), "started": self._t0, "memory": self.memory}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for ev in [meta, *events, proc]:
+                f.write(json.dumps(ev, ensure_ascii=False, default=str) + "\n")
+
+
+NULL = Tracer(False)    # tracer desactivado compartido (valor por defecto de los pipelines)
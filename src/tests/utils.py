@@ -1,14 +1,25 @@
 # pruebas básicas para secuencias pseudoaleatorias
 #   Muestreo, χ² (uniformidad 1D), rachas (Wald–Wolfowitz) y
-#   autocorrelación lag-1  y sin dependencias externas
+#   autocorrelación lag-1 (versiones sobre listas, sin dependencias externas)
+#   StreamAccumulator: las tres pruebas en una sola pasada y memoria constante (NumPy)
+#   autocorr (ρ̂ multi-lag por FFT), Ljung–Box y prueba espectral DFT sobre bits (NumPy)
+#   Batería extendida (kernels bincount/sort de NumPy, p-valores calculados aquí):
+#   serial solapada d-dimensional (ψ² de Good), póker, gap, birthday spacings y KS
 
 import math
-import time
 from typing import Tuple, Dict, List
 
+import numpy as np
+
 
 def sample(prng, n: int = 10_000) -> List[float]:
-    """Genera n valores en [0,1) llamando a prng.random()."""
+    """
+    Genera n valores en [0,1). Usa prng.random_array(n) si existe (generadores
+    de prngs, misma secuencia que random()); si no, llama a prng.random().
+    """
+    batch = getattr(prng, "random_array", None)
+    if batch is not None:
+        return batch(n).tolist()
     return [prng.random() for _ in range(n)]
 
 
@@ -44,10 +55,14 @@ def runs_test_independence(samples: List[float]) -> Dict[str, float]:
         if signs[i] != signs[i - 1]:
             R += 1
 
+    return {"R": R, "Z": _runs_z(R, n1, n2), "n1": n1, "n2": n2}
+
+
+def _runs_z(R: int, n1: int, n2: int) -> float:
+    # Z de Wald–Wolfowitz: (R - μ_R) / σ_R
     mu = 1 + (2 * n1 * n2) / (n1 + n2)
     var = (2 * n1 * n2 * (2 * n1 * n2 - n1 - n2)) / (((n1 + n2) ** 2) * (n1 + n2 - 1))
-    Z = (R - mu) / math.sqrt(var) if var > 0 else float("nan")
-    return {"R": R, "Z": Z, "n1": n1, "n2": n2}
+    return (R - mu) / math.sqrt(var) if var > 0 else float("nan")
 
 
 def autocorr_lag1(samples: List[float]) -> float:
@@ -62,10 +77,371 @@ def autocorr_lag1(samples: List[float]) -> float:
     return num / den if den != 0 else float("nan")
 
 
-def time_gen(prng, n: int = 1_000_000) -> float:
-    """Tiempo (seg) que tarda en generar n valores con prng.random()."""
-    t0 = time.time()
-    acc = 0.0
-    for _ in range(n):
-        acc += prng.random()  # evita que el bucle sea eliminado
-    return time.time() - t0
+class StreamAccumulator:
+    """
+    χ², rachas y ρ̂1 en una sola pasada con memoria constante.
+    update() acepta escalares o bloques (listas/arrays); merge() concatena el flujo de
+    otro acumulador a continuación de este (p.ej. bloques de distintos workers, en orden).
+    Estado: conteos por bin, nº de cambios de signo, n1, sumas de y = x − 0.5
+    (Σy, Σy², Σ y_t·y_{t−1}) y los extremos del flujo para unir bloques.
+    """
+
+    def __init__(self, bins: int = 50):
+        self.bins = int(bins)
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.n = 0
+        self.n1 = 0                 # nº de x ≥ 0.5
+        self.changes = 0            # cambios de signo (R = changes + 1)
+        self.sy = self.syy = self.slag = 0.0
+        self.first = self.last = None
+
+    def update(self, chunk) -> "StreamAccumulator":
+        x = np.asarray(chunk, dtype=np.float64).ravel()
+        if x.size == 0:
+            return self
+        idx = np.minimum((x * self.bins).astype(np.int64), self.bins - 1)
+        self.counts += np.bincount(idx, minlength=self.bins)
+
+        s = x >= 0.5
+        self.n1 += int(np.count_nonzero(s))
+        self.changes += int(np.count_nonzero(s[1:] != s[:-1]))
+
+        y = x - 0.5
+        self.sy += float(y.sum())
+        self.syy += float(np.dot(y, y))
+        self.slag += float(np.dot(y[1:], y[:-1]))
+        if self.last is not None:   # unión con el bloque anterior
+            self.changes += int((self.last >= 0.5) != s[0])
+            self.slag += (self.last - 0.5) * float(y[0])
+        else:
+            self.first = float(x[0])
+        self.last = float(x[-1])
+        self.n += x.size
+        return self
+
+    def merge(self, other: "StreamAccumulator") -> "StreamAccumulator":
+        # self ← self seguido de other (mismo número de bins)
+        if other.bins != self.bins:
+            raise ValueError("no se pueden combinar acumuladores con distinto nº de bins.")
+        if other.n == 0:
+            return self
+        self.counts += other.counts
+        self.n1 += other.n1
+        self.changes += other.changes
+        self.sy += other.sy
+        self.syy += other.syy
+        self.slag += other.slag
+        if self.n:
+            self.changes += int((self.last >= 0.5) != (other.first >= 0.5))
+            self.slag += (self.last - 0.5) * (other.first - 0.5)
+        else:
+            self.first = other.first
+        self.last = other.last
+        self.n += other.n
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.sy / self.n + 0.5 if self.n else float("nan")
+
+    @property
+    def M2(self) -> float:
+        # Σ (x - x̄)^2
+        return self.syy - self.sy * self.sy / self.n if self.n else float("nan")
+
+    def chi_square(self) -> Tuple[float, int]:
+        """Igual que chi_square_uniform(): (chi2, df)."""
+        expected = self.n / self.bins
+        chi2 = float(((self.counts - expected) ** 2).sum() / expected)
+        return chi2, self.bins - 1
+
+    def runs(self) -> Dict[str, float]:
+        """Igual que runs_test_independence(): {"R", "Z", "n1", "n2"}."""
+        n1, n2 = self.n1, self.n - self.n1
+        if n1 == 0 or n2 == 0:
+            return {"R": float("nan"), "Z": float("nan"), "n1": n1, "n2": n2}
+        R = self.changes + 1
+        return {"R": R, "Z": _runs_z(R, n1, n2), "n1": n1, "n2": n2}
+
+    def autocorr_lag1(self) -> float:
+        """Igual que autocorr_lag1(): Σ(x_t-x̄)(x_{t-1}-x̄) / Σ(x_t-x̄)^2."""
+        n = self.n
+        if n < 2:
+            return float("nan")
+        m = self.sy / n             # media de y
+        y0, yl = self.first - 0.5, self.last - 0.5
+        num = self.slag - m * (2 * self.sy - y0 - yl) + (n - 1) * m * m
+        den = self.M2
+        return num / den if den != 0 else float("nan")
+
+
+def stream_stats(prng, n: int, bins: int = 50, chunk: int = 1 << 20) -> StreamAccumulator:
+    """Acumula n valores de prng por bloques de 'chunk' (sin construir la lista completa)."""
+    acc = StreamAccumulator(bins)
+    batch = getattr(prng, "random_array", None)
+    done = 0
+    while done < n:
+        k = min(chunk, n - done)
+        acc.update(batch(k) if batch is not None else [prng.random() for _ in range(k)])
+        done += k
+    return acc
+
+
+def sample_until(prng, rule, bins: int = 50) -> np.ndarray:
+    """
+    Muestreo secuencial: lotes crecientes (rule.batches()) hasta que el p-valor del χ²
+    de uniformidad acumulado (bins celdas, en streaming) cumple rule.met(p, n) (p.ej.
+    montecarlo.sequential.RejectionRule) o se agota el presupuesto. Retorna todas las
+    muestras (float64): la batería las necesita completas, memoria O(n) ≤ 8·max_n bytes.
+    """
+    parts: List[np.ndarray] = []
+    acc = StreamAccumulator(bins)
+    for k in rule.batches():
+        chunk = np.asarray(sample(prng, k), dtype=np.float64)
+        parts.append(chunk)
+        acc.update(chunk)
+        if rule.met(chi2_sf(*acc.chi_square()), acc.n):
+            break
+    return np.concatenate(parts) if parts else np.empty(0)
+
+
+def autocorr(samples, max_lag: int) -> np.ndarray:
+    """
+    ρ̂_k para k = 0..max_lag en O(n log n) vía FFT (ρ̂_0 = 1); mismo estimador que
+    autocorr_lag1: Σ_t (x_t-x̄)(x_{t-k}-x̄) / Σ (x_t-x̄)^2.
+    """
+    y = np.asarray(samples, dtype=np.float64).ravel()
+    n = y.size
+    max_lag = min(int(max_lag), n - 1)
+    y = y - y.mean()
+    nfft = 1 << (2 * n - 1).bit_length()            # relleno con ceros: sin solapamiento circular
+    F = np.fft.rfft(y, nfft)
+    acov = np.fft.irfft(F.real ** 2 + F.imag ** 2, nfft)[:max_lag + 1]
+    if acov[0] == 0:
+        return np.full(max_lag + 1, np.nan)
+    return acov / acov[0]
+
+
+def _gammainc_upper(a: float, x: float) -> float:
+    # Q(a, x) regularizada: serie si x < a+1, fracción continua (Lentz) en otro caso
+    if x <= 0:
+        return 1.0
+    lg = math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(10_000):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(-x + a * math.log(x) - lg))
+    tiny = 1e-300
+    b = x + 1 - a
+    c, d = 1 / tiny, 1 / b
+    h = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(-x + a * math.log(x) - lg) * h
+
+
+def chi2_sf(x: float, df: int) -> float:
+    """p-valor P(χ²_df ≥ x) (función gamma incompleta, sin dependencias externas)."""
+    return _gammainc_upper(df / 2.0, x / 2.0)
+
+
+def ljung_box(rho: np.ndarray, n: int) -> Tuple[float, int, float]:
+    """Q = n(n+2) Σ_{k=1..h} ρ̂_k²/(n-k) ~ χ²_h. rho como lo devuelve autocorr(). Retorna (Q, h, p)."""
+    h = len(rho) - 1
+    k = np.arange(1, h + 1)
+    Q = float(n * (n + 2) * np.sum(rho[1:] ** 2 / (n - k)))
+    return Q, h, chi2_sf(Q, h)
+
+
+def to_bits(samples, bits: int = 8) -> np.ndarray:
+    """Los 'bits' bits más significativos de cada x ∈ [0,1) (MSB primero), como array 0/1."""
+    x = np.asarray(samples, dtype=np.float64).ravel()
+    v = np.minimum((x * (1 << bits)).astype(np.int64), (1 << bits) - 1)
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.int64)
+    return ((v[:, None] >> shifts) & 1).astype(np.int8).ravel()
+
+
+def spectral_test(samples, bits: int = 8) -> Dict[str, float]:
+    """
+    Prueba espectral DFT (NIST SP 800-22 §2.6) sobre el flujo de bits de las muestras.
+    Cuenta picos |S_j| < T = sqrt(ln(1/0.05)·n) en la primera mitad del espectro;
+    bajo H0 se espera N0 = 0.95·n/2. Retorna d normalizado y p = erfc(|d|/√2).
+    """
+    eps = to_bits(samples, bits)
+    n = eps.size
+    X = 2.0 * eps - 1.0
+    mod = np.abs(np.fft.rfft(X))[: n // 2]
+    T = math.sqrt(math.log(1 / 0.05) * n)
+    N0 = 0.95 * n / 2
+    N1 = int(np.count_nonzero(mod < T))
+    d = (N1 - N0) / math.sqrt(n * 0.95 * 0.05 / 4)
+    return {"d": d, "p": math.erfc(abs(d) / math.sqrt(2)), "N1": N1, "N0": N0, "n_bits": n}
+
+
+# ---------------- Batería extendida ----------------
+def _digits(samples, k: int) -> np.ndarray:
+    # x ∈ [0,1) → categoría ⌊k·x⌋ ∈ 0..k−1
+    x = np.asarray(samples, dtype=np.float64).ravel()
+    return np.minimum((x * k).astype(np.int64), k - 1)
+
+
+def chi2_cells(counts, probs, min_expected: float = 5.0) -> Dict[str, float]:
+    """
+    χ² de conteos observados contra probabilidades de celda. Agrupa celdas contiguas
+    (de izquierda a derecha) hasta que cada una espere ≥ min_expected. Retorna chi2, df, p.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    probs = np.asarray(probs, dtype=np.float64)
+    n = counts.sum()
+    obs, exp = [], []
+    o = e = 0.0
+    for c, q in zip(counts, probs * n):
+        o, e = o + c, e + q
+        if e >= min_expected:
+            obs.append(o); exp.append(e)
+            o = e = 0.0
+    if e > 0 and exp:               # resto con poca esperanza: a la última celda
+        obs[-1] += o; exp[-1] += e
+    if len(exp) < 2:
+        return {"chi2": float("nan"), "df": 0, "p": float("nan")}
+    obs, exp = np.array(obs), np.array(exp)
+    chi2 = float(((obs - exp) ** 2 / exp).sum())
+    df = len(exp) - 1
+    return {"chi2": chi2, "df": df, "p": chi2_sf(chi2, df)}
+
+
+def _psi2(v: np.ndarray, d: int, k: int) -> float:
+    # Ψ² de las n d-tuplas solapadas (circulares) de v: (k^d/n) Σ c² − n
+    if d == 0:
+        return 0.0
+    n = v.size
+    w = np.concatenate([v, v[:d - 1]])
+    idx = np.zeros(n, dtype=np.int64)
+    for j in range(d):
+        idx = idx * k + w[j:j + n]
+    counts = np.bincount(idx, minlength=k ** d)
+    return float(k ** d / n * np.dot(counts, counts) - n)
+
+
+def serial_test(samples, d: int = 2, k: int = 8) -> Dict[str, float]:
+    """
+    Prueba serial solapada en d dimensiones con k celdas por eje (k^d celdas).
+    Estadístico de Good ∇ψ² = Ψ²_d − Ψ²_{d−1} ~ χ² con k^d − k^{d−1} gl.
+    """
+    v = _digits(samples, k)
+    stat = _psi2(v, d, k) - _psi2(v, d - 1, k)
+    df = k ** d - k ** (d - 1)
+    return {"stat": stat, "df": df, "p": chi2_sf(stat, df)}
+
+
+def _stirling2(n: int, r: int) -> int:
+    # números de Stirling de segunda especie S(n, r)
+    row = [1] + [0] * r
+    for i in range(1, n + 1):
+        for j in range(min(i, r), 0, -1):
+            row[j] = j * row[j] + row[j - 1]
+        row[0] = 0
+    return row[r]
+
+
+def poker_test(samples, hand: int = 5, k: int = 10) -> Dict[str, float]:
+    """
+    Póker (Knuth): manos de 'hand' valores consecutivos con k categorías; se cuenta el
+    nº r de valores distintos. P(r) = k(k−1)…(k−r+1)·S(hand, r) / k^hand.
+    """
+    v = _digits(samples, k)
+    m = v.size // hand
+    h = np.sort(v[:m * hand].reshape(m, hand), axis=1)
+    r = 1 + np.count_nonzero(np.diff(h, axis=1), axis=1)
+    counts = np.bincount(r, minlength=hand + 1)[1:]
+    probs = [math.perm(k, r) * _stirling2(hand, r) / k ** hand for r in range(1, hand + 1)]
+    return {**chi2_cells(counts, probs), "hands": m}
+
+
+def gap_test(samples, lo: float = 0.0, hi: float = 0.5, t: int = 16) -> Dict[str, float]:
+    """
+    Gap (Knuth): longitudes de los huecos entre visitas a [lo, hi); P(r) = p(1−p)^r
+    para r < t y (1−p)^t para r ≥ t, con p = hi − lo.
+    """
+    x = np.asarray(samples, dtype=np.float64).ravel()
+    hits = np.flatnonzero((x >= lo) & (x < hi))
+    gaps = np.diff(hits) - 1
+    p = hi - lo
+    counts = np.bincount(np.minimum(gaps, t), minlength=t + 1)
+    probs = [p * (1 - p) ** r for r in range(t)] + [(1 - p) ** t]
+    return {**chi2_cells(counts, probs), "gaps": int(gaps.size)}
+
+
+def poisson_two_sided(j: int, lam: float) -> float:
+    """p-valor bilateral de j ~ Poisson(λ): 2·min(P(X ≤ j), P(X ≥ j)), acotado a 1."""
+    cdf = _gammainc_upper(j + 1, lam)                    # P(X ≤ j) = Q(j+1, λ)
+    sf = 1.0 - _gammainc_upper(j, lam) if j > 0 else 1.0  # P(X ≥ j)
+    return min(1.0, 2.0 * min(cdf, sf))
+
+
+def birthday_spacings(samples, m: int = 256, days_bits: int = 24) -> Dict[str, float]:
+    """
+    Birthday spacings (Marsaglia): m cumpleaños en un año de 2^days_bits días por réplica;
+    J = nº de espaciamientos repetidos. Suma sobre T réplicas ~ Poisson(T·m³/(4·días))
+    (aproximación: E[J] queda por debajo de λ, ~0.1% con m=256 y 2^24 días, ~1% con 2^20).
+    """
+    days = 1 << days_bits
+    x = np.asarray(samples, dtype=np.float64).ravel()
+    T = x.size // m
+    if T == 0:
+        return {"J": 0, "lambda": float("nan"), "p": float("nan"), "trials": 0}
+    b = np.minimum((x[:T * m] * days).astype(np.int64), days - 1).reshape(T, m)
+    s = np.sort(np.diff(np.sort(b, axis=1), axis=1, prepend=0), axis=1)
+    J = int(np.count_nonzero(s[:, 1:] == s[:, :-1]))
+    lam = T * m ** 3 / (4 * days)
+    return {"J": J, "lambda": lam, "p": poisson_two_sided(J, lam), "trials": T}
+
+
+def kolmogorov_sf(lam: float) -> float:
+    """P(K > λ) de la distribución de Kolmogorov (dos series según λ)."""
+    if lam <= 0:
+        return 1.0
+    if lam < 1.18:                  # P(K ≤ λ) = √(2π)/λ Σ exp(−(2k−1)²π²/(8λ²))
+        s = sum(math.exp(-(2 * k - 1) ** 2 * math.pi ** 2 / (8 * lam * lam)) for k in range(1, 20))
+        return min(1.0, max(0.0, 1.0 - math.sqrt(2 * math.pi) / lam * s))
+    s = sum((-1) ** (k - 1) * math.exp(-2 * k * k * lam * lam) for k in range(1, 100))
+    return min(1.0, max(0.0, 2.0 * s))
+
+
+def ks_test(samples) -> Dict[str, float]:
+    """
+    Kolmogorov–Smirnov contra Unif[0,1): D = sup |F_n − F|; p con la corrección de
+    Stephens λ = (√n + 0.12 + 0.11/√n)·D.
+    """
+    x = np.sort(np.asarray(samples, dtype=np.float64).ravel())
+    n = x.size
+    i = np.arange(1, n + 1, dtype=np.float64)
+    D = float(max((i / n - x).max(), (x - (i - 1) / n).max()))
+    rn = math.sqrt(n)
+    return {"D": D, "p": kolmogorov_sf((rn + 0.12 + 0.11 / rn) * D)}
+
+
+def time_gen(prng, n: int = 1_000_000, repeats: int = 5, warmup: int = 1) -> float:
+    """
+    Tiempo (seg, mediana de 'repeats' tras 'warmup') de n llamadas a prng.random().
+    Mediciones completas (lote, paralelo, randint, ...): tests.bench / run_bench.py.
+    """
+    from tests.bench import measure
+    rnd = prng.random
+    return measure(lambda: [rnd() for _ in range(n)], repeats, warmup, memory=False)["median_ns"] * 1e-9
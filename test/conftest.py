@@ -0,0 +1,8 @@
+# test/conftest.py
+# Los módulos (prngs, montecarlo, tests, run_*.py) viven en src/ y se importan como al
+# ejecutar los scripts desde ahí.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
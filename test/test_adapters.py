@@ -0,0 +1,92 @@
+# test/test_adapters.py
+# Enteros sin sesgo (randint/randints) y adaptadores NumPy / random.Random.
+
+import copy
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from prngs import LCG, RANDU, MT19937, MiddleSquare, BlumBlumShub, NumpyBitGenerator, PRNGRandom
+from prngs.adapters import SecretsRNG, numpy_generator, uint32_block
+
+GENS = [LCG, RANDU, MT19937, MiddleSquare, BlumBlumShub]
+
+
+# ----- randint / randints -----
+@pytest.mark.parametrize("cls", GENS)
+@pytest.mark.parametrize("low,high", [(0, 1), (1, 6), (-5, 10**12), (0, 2**70)])
+def test_randints_matches_randint(cls, low, high):
+    n = 200 if cls is not BlumBlumShub else 20
+    a, b = cls(), cls()
+    scalar = [a.randint(low, high) for _ in range(n)]
+    assert b.randints(low, high, n).tolist() == scalar
+    assert all(low <= v <= high for v in scalar)
+    assert a.random() == b.random()
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU])
+def test_randint_uses_high_bits(cls):
+    # los bits bajos de un LCG módulo 2^e tienen periodo corto (0,1,0,1,... con v % 2)
+    g = cls()
+    bits = [g.randint(0, 1) for _ in range(4000)]
+    assert bits[:8] not in ([0, 1] * 4, [1, 0] * 4)
+    period4 = [bits[i:i + 4] for i in range(0, 4000, 4)]
+    assert len({tuple(p) for p in period4}) > 8
+    g = cls()
+    counts = np.bincount([g.randint(1, 4) for _ in range(40_000)], minlength=5)[1:]
+    assert (abs(counts - 10_000) < 400).all()
+
+
+def test_randint_validation():
+    with pytest.raises(ValueError):
+        LCG().randint(3, 2)
+
+
+# ----- NumPy -----
+def test_numpy_bitgenerator_matches_randomstate():
+    g = numpy_generator(MT19937(5489))
+    assert g.random(5).tolist() == np.random.RandomState(5489).random_sample(5).tolist()
+    bg = NumpyBitGenerator(MT19937(1))
+    assert bg.random_raw(3).tolist() == MT19937(1).random_uint32(3).tolist()
+
+
+@pytest.mark.parametrize("cls", [RANDU, MiddleSquare])
+def test_uint32_words_are_unbiased(cls):
+    w = uint32_block(cls(seed=4242 if cls is MiddleSquare else 1), 20_000)
+    assert w.dtype == np.uint32
+    if cls is RANDU:                                  # sin bits fijos
+        assert 0.45 < (w & 1).mean() < 0.55
+
+
+# ----- random.Random -----
+@pytest.mark.parametrize("cls", [LCG, RANDU, MT19937])
+def test_prng_random_follows_stream(cls):
+    r, g = PRNGRandom(cls(7)), cls(7)
+    seq = [r.random(), r.getrandbits(16), r.random()]
+    assert seq == [g.random(), g.randint(0, 2**16 - 1), g.random()]
+    assert r.getrandbits(0) == 0 and 0 <= r.getrandbits(100) < 2**100
+
+
+@pytest.mark.parametrize("cls", [LCG, MT19937])
+def test_prng_random_pickle_copy_seed(cls):
+    r = PRNGRandom(cls(3))
+    r.shuffle(list(range(10)))
+    r.gauss(0.0, 1.0)
+    r2, r3 = pickle.loads(pickle.dumps(r)), copy.deepcopy(r)
+    assert [r.random() for _ in range(5)] == [r2.random() for _ in range(5)] == \
+           [r3.random() for _ in range(5)]
+    assert r.gauss(0, 1) == r2.gauss(0, 1)
+    state = r.getstate()
+    x = r.random()
+    r.setstate(state)
+    assert r.random() == x
+    r.seed(11)
+    assert r.random() == cls(11).random()
+    assert isinstance(r, random.Random)
+
+
+def test_secrets_rng_pickles():
+    s = pickle.loads(pickle.dumps(SecretsRNG()))
+    assert isinstance(s, SecretsRNG) and 0.0 <= s.random() < 1.0
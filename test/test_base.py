@@ -0,0 +1,45 @@
+# test/test_base.py
+# API por lotes (BasePRNG): random_array(n) y fill(buffer) = n llamadas a random().
+
+import numpy as np
+import pytest
+
+from prngs import LCG, RANDU, MT19937, MiddleSquare, BlumBlumShub
+
+GENS = [LCG, RANDU, MT19937, MiddleSquare, BlumBlumShub]
+
+
+@pytest.mark.parametrize("cls", GENS)
+def test_random_array_matches_scalar(cls):
+    a, b = cls(), cls()
+    scalar = [a.random() for _ in range(1500)]
+    assert b.random_array(1500).tolist() == scalar
+    assert a.random() == b.random()          # mismo estado al terminar
+
+
+@pytest.mark.parametrize("cls", GENS)
+def test_fill_matches_scalar(cls):
+    a, b = cls(), cls()
+    buf = np.empty(700)
+    a.fill(buf)
+    assert buf.tolist() == [b.random() for _ in range(700)]
+
+
+@pytest.mark.parametrize("cls", GENS)
+def test_fill_strided_view_and_array(cls):
+    from array import array
+    a, b = cls(), cls()
+    buf = np.zeros((10, 2))
+    a.fill(buf[:, 0])
+    arr = array("d", bytes(8 * 5))
+    a.fill(arr)
+    ref = b.random_array(15).tolist()
+    assert buf[:, 0].tolist() + list(arr) == ref
+    assert buf[:, 1].tolist() == [0.0] * 10
+
+
+def test_fill_rejects_wrong_buffer():
+    with pytest.raises(TypeError):
+        LCG().fill(np.empty(3, dtype=np.float32))
+    with pytest.raises(ValueError):
+        LCG().random_array(-1)
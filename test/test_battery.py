@@ -0,0 +1,60 @@
+# test/test_battery.py
+# p-valores propios (tests.utils) contra valores de tabla y comportamiento bajo H0 / H1.
+
+import math
+
+import numpy as np
+import pytest
+
+from prngs import MT19937
+from tests.utils import (_stirling2, birthday_spacings, chi2_sf, gap_test, kolmogorov_sf,
+                         ks_test, poisson_two_sided, poker_test, serial_test)
+
+
+@pytest.mark.parametrize("x,df,p", [
+    (3.841458820694124, 1, 0.05),
+    (18.307038053275146, 10, 0.05),
+    (2.0, 2, math.exp(-1.0)),
+    (67.50480642486, 50, 0.05),
+])
+def test_chi2_sf(x, df, p):
+    assert chi2_sf(x, df) == pytest.approx(p, rel=1e-3)
+
+
+@pytest.mark.parametrize("lam,p", [(1.3580986393225507, 0.05), (1.6276236115189577, 0.01),
+                                   (0.5, 0.9639452436648751)])
+def test_kolmogorov_sf(lam, p):
+    assert kolmogorov_sf(lam) == pytest.approx(p, rel=1e-4)
+
+
+def test_poisson_and_stirling():
+    assert _stirling2(5, 3) == 25 and _stirling2(10, 10) == 1 and _stirling2(4, 0) == 0
+    # P(J ≤ 0) = e^{−λ} → p bilateral = 2·min(P(≤j), P(≥j)) acotado en 1
+    assert poisson_two_sided(0, 2.0) == pytest.approx(2 * math.exp(-2.0))
+    assert poisson_two_sided(2, 2.0) == 1.0
+
+
+@pytest.fixture(scope="module")
+def good():
+    return MT19937().random_array(200_000)
+
+
+def test_battery_accepts_good_generator(good):
+    ps = [serial_test(good, 2, 8)["p"], serial_test(good, 3, 4)["p"], poker_test(good)["p"],
+          gap_test(good)["p"], birthday_spacings(good)["p"], ks_test(good)["p"]]
+    assert all(1e-4 < p <= 1.0 for p in ps), ps
+
+
+def test_battery_rejects_bad_sequences(good):
+    sorted_x = np.sort(good)                          # uniforme en 1D, sin independencia
+    assert serial_test(sorted_x, 2, 8)["p"] < 1e-6
+    assert gap_test(sorted_x)["p"] < 1e-6
+    squeezed = good ** 1.05                           # no uniforme
+    assert ks_test(squeezed)["p"] < 1e-6
+    assert poker_test(np.floor(good * 5) / 10)["p"] < 1e-6   # solo 5 de 10 dígitos
+
+
+def test_p_values_roughly_uniform_under_h0():
+    g = MT19937(1)
+    ps = np.array([ks_test(g.random_array(500))["p"] for _ in range(300)])
+    assert 0.4 < ps.mean() < 0.6 and (ps < 0.05).mean() < 0.12
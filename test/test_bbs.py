@@ -0,0 +1,43 @@
+# test/test_bbs.py
+# Blum Blum Shub: acceso directo (CRT) = iterar cuadrados; extracción de k bits por paso.
+
+import pytest
+
+from prngs import BlumBlumShub
+
+
+def test_state_at_matches_iteration():
+    g = BlumBlumShub()
+    x = g.x0
+    for i in range(1, 300):
+        x = pow(x, 2, g.M)
+        assert g.state_at(i) == x
+
+
+def test_seek_matches_steps():
+    a, b = BlumBlumShub(bits_per_step=3), BlumBlumShub(bits_per_step=3)
+    a.random_array(40)
+    b.seek(a.pos)
+    assert a.random_array(20).tolist() == b.random_array(20).tolist()
+
+
+def test_multibit_extraction():
+    # random(bits) empaqueta los k bits bajos de cada cuadrado, el más antiguo arriba
+    g = BlumBlumShub(bits_per_step=2)
+    x, v = g.x0, 0
+    for _ in range(16):                              # 32 bits, 2 por cuadrado
+        x = pow(x, 2, g.M)
+        v = (v << 2) | (x & 3)
+    assert g.random() == v / 2**32
+
+
+def test_large_key_and_validation():
+    g = BlumBlumShub.with_key_size(512, seed=12345)
+    assert g.M.bit_length() in (511, 512) and g.k == g.max_bits_per_step
+    a = BlumBlumShub(seed=7, p=g.p, q=g.q, bits_per_step=g.k)
+    a.random_array(5)
+    assert a.state == a.state_at(a.pos)
+    with pytest.raises(ValueError):
+        BlumBlumShub(p=13, q=503)
+    with pytest.raises(ValueError):
+        BlumBlumShub(bits_per_step=99)
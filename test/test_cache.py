@@ -0,0 +1,67 @@
+# test/test_cache.py
+# Caché de flujos (prngs.cache): misma secuencia que el generador, en float64 y uint32.
+
+import copy
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from prngs import LCG, RANDU, MT19937, MiddleSquare, BlumBlumShub
+from prngs.cache import CachedStream, StreamCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StreamCache(str(tmp_path), segment=1 << 10)
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU, MT19937, MiddleSquare])
+def test_float64_matches_generator(cache, cls):
+    ref = cls(seed=11).random_array(5000)
+    got = cache.get(cls, {}, 11, 1500, 2500)          # cruza segmentos, empieza a mitad
+    assert got.tolist() == ref[1500:4000].tolist()
+    assert cache.get(cls, {}, 11, 0, 5000).tolist() == ref.tolist()
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU, MT19937, MiddleSquare, BlumBlumShub])
+def test_uint32_matches_raw_words(cache, cls):
+    n = 1500 if cls is not BlumBlumShub else 300
+    ref = cls(seed=11).random_words(2 * n)
+    got = cache.get(cls, {}, 11, n, n, kind="uint32")
+    assert got.dtype == np.uint32
+    assert got.tolist() == ref[n:].tolist()
+
+
+def test_uint32_rejects_wide_words(cache):
+    with pytest.raises(ValueError):
+        cache.get(LCG, {"m": 2**33, "a": 5, "c": 1}, 1, 0, 10, kind="uint32")
+    with pytest.raises(ValueError):
+        cache.key(LCG, {}, 1, kind="int8")
+
+
+def test_cached_stream_matches_generator(cache):
+    s, g = CachedStream(cache, LCG, {}, 7, block=100), LCG(seed=7)
+    out, ref = [], []
+    for i in range(3000):
+        if i % 7 == 0:
+            out += s.random_array(5).tolist()
+            ref += g.random_array(5).tolist()
+        elif i % 11 == 0:
+            s.jump(1000)
+            g.jump(1000)
+        else:
+            out.append(s.random())
+            ref.append(g.random())
+    assert out == ref
+    s2, s3 = pickle.loads(pickle.dumps(s)), copy.deepcopy(s)
+    assert s2.random() == s3.random() == s.random() == g.random()
+
+
+def test_lru_eviction(tmp_path):
+    c = StreamCache(str(tmp_path), segment=1 << 10, max_bytes=3 * 8 * (1 << 10))
+    for seed in range(5):                             # 5 segmentos de 8 KiB, límite 24 KiB
+        c.get(LCG, {}, seed, 0, 10)
+    assert c.size() <= c.max_bytes
+    assert c.get(LCG, {}, 0, 0, 10).tolist() == LCG(seed=0).random_array(10).tolist()
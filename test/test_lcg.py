@@ -0,0 +1,46 @@
+# test/test_lcg.py
+# LCG / RANDU: jump(k) = k pasos (O(log k)) y subflujos de spawn().
+
+import numpy as np
+import pytest
+
+from prngs import LCG, RANDU
+from prngs.lcg import spawn_stride
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU])
+@pytest.mark.parametrize("pre,k", [(0, 0), (0, 1), (5, 623), (3, 10**5)])
+def test_jump_matches_steps(cls, pre, k):
+    a, b = cls(), cls()
+    a.random_array(pre)
+    b.random_array(pre)
+    a.jump(k)
+    b.random_array(k)
+    assert a.random_array(50).tolist() == b.random_array(50).tolist()
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU])
+def test_spawn_starts_at_stride_multiples(cls):
+    g = cls(seed=99)
+    streams = g.spawn(3, stride=1000)
+    ref = cls(seed=99).random_array(3000)
+    for i, s in enumerate(streams):
+        assert s.random_array(5).tolist() == ref[1000 * i:1000 * i + 5].tolist()
+    assert g.random() == cls(seed=99).random()      # el original no cambia
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU])
+@pytest.mark.parametrize("n", [2, 4, 8, 16])
+def test_spawn_streams_are_not_translates(cls, n):
+    # con una distancia potencia de 2, (s_{i+1} − s_i) mod 1 era constante
+    streams = [s.random_array(10_000) for s in cls().spawn(n)]
+    for s0, s1 in zip(streams, streams[1:]):
+        d = np.mod(s1 - s0, 1.0)
+        assert d.std() > 0.25                       # Unif(0,1): 0.289
+        assert np.unique(np.round(d, 6)).size > 1000
+
+
+def test_spawn_stride_is_odd_and_disjoint():
+    for span, n in [(2**32, 4), (2**29, 8), (2**32, 3), (10, 5)]:
+        s = spawn_stride(span, n)
+        assert s % 2 == 1 and n * s <= span
@@ -0,0 +1,89 @@
+# test/test_montecarlo.py
+# Integrador Monte Carlo vectorizado (montecarlo.integrate).
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from montecarlo.integrate import RunningMoments, integrate, uniforms
+from prngs import LCG, MT19937
+
+f_sin = np.sin
+
+
+def test_running_moments_merge_matches_numpy():
+    x = MT19937().random_array(10_001)
+    mom = RunningMoments()
+    for part in np.array_split(x, 9):
+        mom.merge(RunningMoments().update(part))
+    assert mom.n == x.size
+    assert mom.mean == pytest.approx(x.mean(), rel=1e-12)
+    assert mom.var == pytest.approx(x.var(ddof=1), rel=1e-10)
+
+
+@pytest.mark.parametrize("chunk", [7, 1000, 1 << 16])
+def test_integrate_matches_direct_estimate(chunk):
+    n = 20_000
+    u = LCG().random_array(n)
+    fx = f_sin(2.0 * u)
+    est, se, _ = integrate(f_sin, 0.0, 2.0, LCG(), n, chunk=chunk)
+    assert est == pytest.approx(2.0 * fx.mean(), rel=1e-12)
+    assert se == pytest.approx(2.0 * fx.std(ddof=1) / math.sqrt(n), rel=1e-9)
+    assert abs(est - (1 - math.cos(2.0))) < 5 * se     # ∫_0^2 sin = 1 − cos 2
+
+
+def test_uniforms_without_batch_api():
+    r, ref = random.Random(3), random.Random(3)
+    assert uniforms(r, 5).tolist() == [ref.random() for _ in range(5)]
+
+
+# ----- Shards (mismo resultado que en serie, para cualquier nº de workers) -----
+from concurrent.futures import ProcessPoolExecutor
+
+from montecarlo.integrate import (integrate_sharded, integrate_stream_sharded, shard_sizes,
+                                  substream)
+from prngs import RANDU
+
+
+def test_shard_sizes():
+    assert shard_sizes(10, 3) == [4, 3, 3]
+    assert sum(shard_sizes(200_000, 32)) == 200_000
+
+
+@pytest.mark.parametrize("cls", [LCG, RANDU, MT19937])
+@pytest.mark.parametrize("workers", [0, 1, 2, 3])
+def test_sharded_matches_across_workers(cls, workers):
+    n, shards, offset = 30_000, 7, 1234
+    sizes = shard_sizes(n, shards)
+    g = cls()
+    # subflujos nuevos en cada uso (en serie, integrate_sharded los avanza)
+    rngs = lambda: [substream(g, offset + sum(sizes[:i])) for i in range(shards)]
+    ref = integrate_sharded(f_sin, 0.0, 2.0, rngs(), sizes)
+    ex = ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        got = integrate_stream_sharded(f_sin, 0.0, 2.0, g, sizes, executor=ex, offset=offset)
+        got2 = integrate_sharded(f_sin, 0.0, 2.0, rngs(), sizes, executor=ex)
+    finally:
+        if ex is not None:
+            ex.shutdown()
+    assert got == ref == got2
+    assert g.random() == cls().random()               # el generador original no cambia
+    # mismas muestras que la integración secuencial sobre [offset, offset + n)
+    serial = cls()
+    serial.jump(offset)
+    est, _, _ = integrate(f_sin, 0.0, 2.0, serial, n)
+    assert got[0] == pytest.approx(est, rel=1e-12)
+
+
+def test_run_parte2_sharded_glue():
+    import run_parte2 as p2
+    n = 20_000
+    ref = p2.mc_integral_stats(p2.f1_vec, 0.0, 1.0, LCG(), n)
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        got = p2.mc_integral_stats_sharded(p2.f1_vec, 0.0, 1.0, LCG(), n, 4, ex)
+    assert got[0] == pytest.approx(ref[0], rel=1e-12)
+    # sin jump(): flujo secuencial
+    r = p2.mc_integral_stats_sharded(p2.f1_vec, 0.0, 1.0, random.Random(1), n, 4)
+    assert r == p2.mc_integral_stats(p2.f1_vec, 0.0, 1.0, random.Random(1), n)
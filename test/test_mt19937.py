@@ -0,0 +1,58 @@
+# test/test_mt19937.py
+# MT19937: salida de referencia (np.random.RandomState usa el mismo algoritmo) y saltos.
+
+import numpy as np
+import pytest
+
+from prngs import MT19937
+
+
+@pytest.mark.parametrize("seed", [5489, 123, 2**32 - 1])
+def test_matches_reference(seed):
+    g = MT19937(seed)
+    ref = np.random.RandomState(seed).randint(0, 2**32, 2000, dtype=np.uint32)
+    assert g.random_uint32(2000).tolist() == ref.tolist()
+
+
+def test_scalar_block_mix():
+    a, b = MT19937(), MT19937()
+    out = [a.extract_number() for _ in range(7)] + a.random_uint32(1300).tolist()
+    assert out == b.random_uint32(1307).tolist()
+
+
+# ----- Saltos (mt_jump) -----
+@pytest.fixture
+def jump_cache(tmp_path, monkeypatch):
+    # polinomios en un directorio temporal (sin tocar out/cache)
+    from prngs import mt_jump
+    monkeypatch.setattr(mt_jump, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(mt_jump, "_memo", {})
+    mt_jump._jump_poly_mem.cache_clear()
+    return tmp_path
+
+
+@pytest.mark.parametrize("pre,k", [(0, 0), (5, 623), (624, 10**5), (3, MT19937.JUMP_MIN + 12345)])
+def test_jump_matches_steps(jump_cache, pre, k):
+    # debajo de JUMP_MIN se descartan bloques; encima, polinomio sobre GF(2)
+    a, b = MT19937(7), MT19937(7)
+    a.random_array(pre)
+    b.random_array(pre)
+    a.jump(k)
+    b.random_array(k)
+    assert a.random_array(700).tolist() == b.random_array(700).tolist()
+
+
+def test_polynomial_jumps_compose(jump_cache):
+    k = MT19937.JUMP_MIN + 3
+    a, b = MT19937(11), MT19937(11)
+    a.jump(k)
+    a.jump(k)
+    b.jump(2 * k)
+    assert a.random_uint32(100).tolist() == b.random_uint32(100).tolist()
+
+
+def test_only_fixed_distances_persist(jump_cache):
+    MT19937().jump(MT19937.JUMP_MIN + 1)
+    assert sorted(p.name for p in jump_cache.iterdir()) == ["mt19937_charpoly.hex"]
+    MT19937().spawn(2)                              # 2^128 (PERSIST_STEPS)
+    assert len(list(jump_cache.iterdir())) == 2
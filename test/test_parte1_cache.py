@@ -0,0 +1,55 @@
+# test/test_parte1_cache.py
+# run_parte1 incremental: reutiliza resultados con la misma clave de contenido.
+
+import ast
+import json
+import re
+
+import pytest
+
+import run_parte1 as p1
+
+
+def _run(capsys, *argv):
+    p1.main(["--no-plots", *argv])
+    out = capsys.readouterr().out
+    m = re.search(r"recalcula (\[.*?\]), reutiliza (\[.*?\])", out)
+    return ast.literal_eval(m.group(1)), ast.literal_eval(m.group(2))
+
+
+def _results(tmp_path):
+    with open(tmp_path / "parte1_summary.json", encoding="utf-8") as f:
+        return {r["name"]: r for r in json.load(f)["results"]}
+
+
+@pytest.fixture
+def out_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(p1, "OUT", str(tmp_path))
+    return tmp_path
+
+
+def test_reuse_and_invalidation(out_dir, capsys, monkeypatch):
+    todo, reused = _run(capsys)
+    assert reused == [] and "LCG" in todo
+    first = _results(out_dir)
+
+    todo, reused = _run(capsys)                        # misma clave: todo reutilizado
+    assert todo == [] and "LCG" in reused
+    assert _results(out_dir)["LCG"] == first["LCG"]
+
+    todo, _ = _run(capsys, "--only", "LCG")            # recálculo forzado
+    assert todo == ["LCG"]
+    assert _results(out_dir)["LCG"]["chi2"] == first["LCG"]["chi2"]
+
+    monkeypatch.setattr(p1, "SERIAL_K", {2: 4, 3: 2})  # parámetro de la batería
+    todo, reused = _run(capsys)
+    assert reused == [] and _results(out_dir)["LCG"]["serial2_df"] != first["LCG"]["serial2_df"]
+
+
+def test_cache_key_depends_on_config(monkeypatch):
+    base = p1.cache_key({"cls": "LCG", "seed": 1}, None, "v")
+    assert base == p1.cache_key({"cls": "LCG", "seed": 1}, None, "v")
+    assert base != p1.cache_key({"cls": "LCG", "seed": 2}, None, "v")
+    assert base != p1.cache_key({"cls": "LCG", "seed": 1}, None, "v2")
+    monkeypatch.setattr(p1, "GAP_RANGE", (0.0, 0.25))
+    assert base != p1.cache_key({"cls": "LCG", "seed": 1}, None, "v")
@@ -0,0 +1,52 @@
+# test/test_sequential.py
+# Reglas de parada secuencial: StoppingRule (IC de un estimador) y RejectionRule (p-valor).
+
+import math
+
+import numpy as np
+import pytest
+
+from montecarlo.integrate import integrate_adaptive
+from montecarlo.sequential import RejectionRule, StoppingRule
+from prngs import MT19937, MiddleSquare
+from tests.utils import sample_until
+
+
+def test_stopping_rule_batches_and_target():
+    rule = StoppingRule(abs_tol=1e-3, rel_tol=1e-2, max_n=10_000, n0=1000, growth=2.0)
+    assert list(rule.batches()) == [1000, 2000, 4000, 3000]
+    assert rule.target(0.05) == 1e-3 and rule.target(1.0) == 1e-2
+    assert not rule.met(1.0, 1e-9, 999)               # n0 mínimo
+    assert rule.met(1.0, 0.005, 1000) and not rule.met(1.0, 0.006, 1000)
+    with pytest.raises(ValueError):
+        StoppingRule()
+    with pytest.raises(ValueError):
+        StoppingRule(abs_tol=1e-3, max_n=10, n0=100)
+
+
+def test_integrate_adaptive_reaches_target():
+    rule = StoppingRule(abs_tol=2e-3, max_n=10**6, n0=1000)
+    r = integrate_adaptive(np.sin, 0.0, 1.0, MT19937(), rule)
+    assert r["converged"] and rule.z * r["se"] <= 2e-3
+    assert abs(r["est"] - (1 - math.cos(1.0))) < 5 * r["se"]
+    # presupuesto insuficiente: se detiene en max_n sin converger
+    r = integrate_adaptive(np.sin, 0.0, 1.0, MT19937(), StoppingRule(abs_tol=1e-6, max_n=5000, n0=1000))
+    assert not r["converged"] and r["n"] == 5000
+
+
+def test_rejection_rule_bonferroni():
+    rule = RejectionRule(alpha=0.01, max_n=80_000, n0=10_000)
+    assert rule.looks == 4                            # 10k, 20k, 40k, 10k
+    assert rule.met(0.0024, 10_000) and not rule.met(0.0026, 10_000)
+    assert not rule.met(0.0, 9_999)
+    with pytest.raises(ValueError):
+        RejectionRule(alpha=0.0)
+
+
+def test_sample_until_stops_on_rejection():
+    rule = RejectionRule(alpha=0.01, max_n=100_000, n0=1000)
+    bad = sample_until(MiddleSquare(), rule, bins=35)   # cae en un ciclo corto: rechazo inmediato
+    assert bad.size == 1000
+    good = sample_until(MT19937(), rule, bins=35)       # sano: presupuesto completo
+    assert good.size == 100_000 and good.dtype == np.float64
+    assert good.tolist() == MT19937().random_array(100_000).tolist()
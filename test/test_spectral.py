@@ -0,0 +1,52 @@
+# test/test_spectral.py
+# Prueba espectral analítica: valores de Knuth (TAOCP vol. 2, §3.3.4) y fuerza bruta.
+
+import itertools
+
+import pytest
+
+from prngs import LCG, RANDU
+from prngs.spectral import analyze_lattice, lattice_modulus, screen, spectral
+
+
+def test_randu_knuth_values():
+    r = analyze_lattice(RANDU())
+    assert r["m"] == 2**29                              # a ≡ 3 (mod 8): módulo m/4
+    nu2 = {t: d["nu2"] for t, d in r["dims"].items()}
+    assert nu2[2] == 536936458 and nu2[3] == 118 and nu2[4] == 116
+
+
+@pytest.mark.parametrize("a,expected", [
+    (1664525, {2: 4938916874, 3: 2322494, 4: 63712, 5: 4092, 6: 1038}),
+    (69069, {2: 4243209856}),
+])
+def test_lcg_knuth_values(a, expected):
+    r = spectral(a, 2**32, dims=tuple(expected))
+    assert {t: d["nu2"] for t, d in r["dims"].items()} == expected
+
+
+@pytest.mark.parametrize("a,m", [(5, 64), (37, 256), (21, 1000), (171, 30269)])
+def test_matches_brute_force(a, m):
+    r = spectral(a, m, dims=(2, 3))
+    for t in (2, 3):
+        R = 12 if t == 2 else 8
+        zeros = [s for s in itertools.product(range(-R, R + 1), repeat=t)
+                 if any(s) and sum(si * pow(a, i, m) for i, si in enumerate(s)) % m == 0]
+        best = min((sum(x * x for x in s) for s in zeros), default=float("inf"))
+        assert r["dims"][t]["nu2"] <= best              # R acota la búsqueda exhaustiva
+        v = r["dims"][t]["vector"]
+        assert sum(x * x for x in v) == r["dims"][t]["nu2"]
+        assert sum(vi * pow(a, i, m) for i, vi in enumerate(v)) % m == 0
+        if r["dims"][t]["nu2"] <= R * R:                # dentro del rango: igualdad exacta
+            assert r["dims"][t]["nu2"] == best
+
+
+def test_lattice_modulus_and_screen():
+    assert lattice_modulus(65539, 0, 2**31) == 2**29
+    assert lattice_modulus(1664525, 1013904223, 2**32) == 2**32
+    top = screen([65539, 69069, 1664525, 5, 1103515245], 2**32, dims=(2, 3, 4), top=2)
+    assert [row["a"] for row in top][0] in (69069, 1664525, 1103515245)
+    assert top[0]["min_S"] >= top[1]["min_S"]
+    assert all(row["a"] not in (5, 65539) for row in top)
+    with pytest.raises(TypeError):
+        analyze_lattice(object())
@@ -0,0 +1,29 @@
+# test/test_startup.py
+# Arranque: "import prngs" perezoso y --no-plots sin matplotlib (intérprete nuevo).
+
+import os
+import subprocess
+import sys
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def _modules_after(code: str, cwd: str) -> set:
+    out = subprocess.run([sys.executable, "-c", code + "\nimport sys; print(' '.join(sys.modules))"],
+                         cwd=cwd, env=dict(os.environ, PYTHONPATH=SRC),
+                         capture_output=True, text=True, check=True).stdout
+    return set(out.splitlines()[-1].split())
+
+
+def test_lazy_package_import():
+    mods = _modules_after("import prngs", SRC)
+    assert "numpy" not in mods and "prngs.base" not in mods
+
+
+def test_no_plots_skips_matplotlib(tmp_path):
+    code = ("import run_parte1 as p1\n"
+            f"p1.OUT = {str(tmp_path)!r}\n"
+            "p1.main(['--no-plots', '--only', 'LCG'])")
+    mods = _modules_after(code, SRC)
+    assert "numpy" in mods and "matplotlib" not in mods
+    assert (tmp_path / "parte1_summary.json").exists()
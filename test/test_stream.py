@@ -0,0 +1,45 @@
+# test/test_stream.py
+# StreamAccumulator: una pasada por bloques (y merge de bloques) = funciones sobre la lista.
+
+import numpy as np
+import pytest
+
+from prngs import MT19937, RANDU
+from tests.utils import (StreamAccumulator, autocorr_lag1, chi_square_uniform,
+                         runs_test_independence, stream_stats)
+
+
+@pytest.fixture(scope="module")
+def xs():
+    return MT19937().random_array(10_000)
+
+
+def test_single_pass_matches_list_functions(xs):
+    acc = StreamAccumulator(20)
+    for part in np.array_split(xs, 7):
+        acc.update(part)
+    chi2, df = chi_square_uniform(xs.tolist(), bins=20)
+    assert acc.chi_square() == (pytest.approx(chi2, rel=1e-12), df)
+    ref = runs_test_independence(xs.tolist())
+    runs = acc.runs()
+    assert runs["R"] == ref["R"] and runs["Z"] == pytest.approx(ref["Z"], rel=1e-12)
+    assert acc.autocorr_lag1() == pytest.approx(autocorr_lag1(xs.tolist()), rel=1e-9)
+
+
+def test_merge_matches_single_pass(xs):
+    whole = StreamAccumulator(20).update(xs)
+    merged = StreamAccumulator(20)
+    for part in np.split(xs, [1, 2500, 7000]):
+        merged.merge(StreamAccumulator(20).update(part))
+    merged.merge(StreamAccumulator(20))              # acumulador vacío: sin efecto
+    assert merged.counts.tolist() == whole.counts.tolist()
+    assert merged.runs() == whole.runs()
+    assert merged.autocorr_lag1() == pytest.approx(whole.autocorr_lag1(), rel=1e-9)
+    with pytest.raises(ValueError):
+        merged.merge(StreamAccumulator(10))
+
+
+def test_stream_stats_chunks():
+    acc = stream_stats(RANDU(), 5000, bins=10, chunk=333)
+    ref = StreamAccumulator(10).update(RANDU().random_array(5000))
+    assert acc.n == 5000 and acc.counts.tolist() == ref.counts.tolist()
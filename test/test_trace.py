@@ -0,0 +1,89 @@
+# test/test_trace.py
+# Tracer: desactivado no envuelve nada; activado cuenta extracciones y mide etapas.
+
+import copy
+import json
+import tracemalloc
+
+import pytest
+
+from prngs import LCG, MT19937, BlumBlumShub
+from tests.trace import NULL, CountingRNG, Tracer
+
+
+@pytest.fixture
+def traced_memory():
+    was = tracemalloc.is_tracing()
+    yield
+    if not was and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def test_disabled_is_noop(tmp_path):
+    g = LCG()
+    assert NULL.wrap(g, "lcg") is g
+    assert NULL.stage("a") is Tracer(False).stage("b", n=1)
+    with NULL.stage("a"):
+        pass
+    NULL.count("lcg", draws=10)
+    NULL.write(str(tmp_path / "t.jsonl"))
+    assert NULL.events == [] and not (tmp_path / "t.jsonl").exists()
+
+
+def test_counting_rng_counts_and_forwards():
+    tr = Tracer(True)
+    g = tr.wrap(LCG(7), "lcg")
+    assert isinstance(g, CountingRNG)
+    ref = LCG(7)
+    assert g.random() == ref.random()
+    assert g.random_array(10).tolist() == ref.random_array(10).tolist()
+    g.randints(0, 5, 4); ref.randints(0, 5, 4)
+    g.jump(100); ref.jump(100)
+    assert g.random() == ref.random()
+    assert (g.a, g.state) == (ref.a, ref.state)       # atributos sin contar
+    c = g.counts()
+    assert (c["calls"], c["draws"], c["jumped"]) == (4, 16, 100)
+    assert c["state_advances"] == 116 and c["class"] == "LCG"
+
+
+def test_counting_rng_copies_share_counts():
+    g = Tracer(True).wrap(MT19937(1), "mt")
+    h = copy.deepcopy(g)
+    h.random_array(5); g.random()
+    assert g.counts()["draws"] == h.counts()["draws"] == 6
+
+
+def test_state_advances_follow_bbs_pos():
+    g = Tracer(True).wrap(BlumBlumShub(), "bbs")
+    g.random_array(3)
+    c = g.counts()
+    assert c["draws"] == 3 and c["state_advances"] == g.wrapped.pos - 0 > 0
+
+
+def test_stage_events_and_nested_peaks(traced_memory):
+    tr = Tracer(True, memory=True)
+    with tr.stage("outer", gen="lcg"):
+        with tr.stage("inner"):
+            buf = bytearray(2_000_000)
+        del buf
+    inner, outer = tr.events
+    assert (inner["stage"], outer["stage"], outer["gen"]) == ("inner", "outer", "lcg")
+    assert inner["time_s"] >= 0 and outer["time_s"] >= inner["time_s"]
+    assert inner["peak_bytes"] >= 2_000_000
+    assert outer["peak_bytes"] >= inner["peak_bytes"]
+
+
+def test_write_jsonl(tmp_path):
+    tr = Tracer(True)
+    with tr.stage("chi2", n=10):
+        tr.wrap(LCG(), "lcg").random_array(10)
+    tr.count("mt", draws=5, shard=0)
+    tr.extend([{"type": "stage", "stage": "worker", "time_s": 0.0}])
+    path = tmp_path / "sub" / "trace.jsonl"
+    tr.write(str(path))
+    lines = [json.loads(l) for l in path.read_text(encoding="utf-8").splitlines()]
+    assert [ev["type"] for ev in lines] == ["meta", "stage", "draws", "stage", "draws", "process"]
+    assert lines[0]["memory"] is False and "peak_bytes" not in lines[1]
+    assert lines[2] == {"type": "draws", "generator": "mt", "draws": 5, "shard": 0}
+    assert lines[4]["generator"] == "lcg" and lines[4]["draws"] == 10
+    assert lines[-1]["wall_s"] >= 0
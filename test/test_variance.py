@@ -0,0 +1,45 @@
+# test/test_variance.py
+# Estimadores con reducción de varianza: insesgados, presupuesto de n evaluaciones y vrf.
+
+import math
+
+import numpy as np
+import pytest
+
+from montecarlo.variance import ESTIMATORS, stratified, van_der_corput
+from prngs import LCG, MT19937
+
+EXACT = 1 - math.cos(1.0)                            # ∫_0^1 sin
+
+
+@pytest.mark.parametrize("name", sorted(ESTIMATORS))
+def test_estimators_are_consistent(name):
+    r = ESTIMATORS[name](np.sin, 0.0, 1.0, MT19937(), 50_000)
+    assert abs(r["est"] - EXACT) < 5 * r["se"]
+    lo, hi = r["ci"]
+    assert lo < r["est"] < hi
+    assert r["n_evals"] <= 50_000
+
+
+@pytest.mark.parametrize("name", ["antithetic", "control", "stratified", "qmc"])
+def test_variance_is_reduced(name):
+    # sin es monótona y suave en [0, 1]: todos los métodos deben ganarle a MC simple
+    r = ESTIMATORS[name](np.sin, 0.0, 1.0, MT19937(), 50_000)
+    assert r["vrf"] > 2.0
+
+
+@pytest.mark.parametrize("n", [200_000, 100_003, 4_097])
+@pytest.mark.parametrize("strata", [7, 32])
+def test_stratified_uses_exact_budget(n, strata):
+    r = stratified(np.sin, 0.0, 2.0, LCG(), n, strata=strata)
+    assert r["n_calls"] == r["n_evals"] == n
+
+
+def test_crude_calls():
+    r = ESTIMATORS["crude"](np.sin, 0.0, 1.0, LCG(), 1234)
+    assert r["n_calls"] == r["n_evals"] == 1234
+
+
+def test_van_der_corput():
+    assert van_der_corput(4, 2, start=1).tolist() == [0.5, 0.25, 0.75, 0.125]
+    assert van_der_corput(3, 3, start=1).tolist() == pytest.approx([1 / 3, 2 / 3, 1 / 9])